@@ -9,16 +9,226 @@ Usage:
     python analyze_component.py <component_file>
     python analyze_component.py Button.tsx --json
     python analyze_component.py src/components/ --recursive
+    python analyze_component.py src/components/ --no-cache
+
+Results for unchanged files are reused from an on-disk cache under
+$XDG_CACHE_HOME/storybook-assistant (default ~/.cache); --no-cache bypasses it.
+
+Scanning uses Hyperscan when it is installed (pip install hyperscan) and falls
+back to Python's re module otherwise. Contrast ratios are computed in NumPy
+batches when NumPy is installed. JSON is encoded with orjson when it is
+installed. With --json, a directory is reported as NDJSON: one compact object
+per file, written as each file's report is ready.
 """
 
+import os
 import re
 import json
+import sqlite3
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Patterns are compiled once per process rather than on every check call.
+# Rule patterns run over the raw file bytes; the rest over decoded payloads.
+BUTTON_RE = re.compile(rb"<button([^>]*?)>(.*?)</button>", re.DOTALL)
+IMG_RE = re.compile(rb"<img\s+([^>]*?)/?>")
+INPUT_RE = re.compile(rb"<input\s+([^>]*?)/?>")
+STYLE_RE = re.compile(rb"style=\{\{([^}]+)\}\}")
+REDUNDANT_RES = [
+    (re.compile(rb'<button[^>]*role="button"'), "button", "button"),
+    (re.compile(rb'<nav[^>]*role="navigation"'), "nav", "navigation"),
+    (re.compile(rb'<main[^>]*role="main"'), "main", "main"),
+    (re.compile(rb'<aside[^>]*role="complementary"'), "aside", "complementary"),
+]
+FOCUS_REMOVAL_RES = [
+    re.compile(rb'outline:\s*["\']?none["\']?'),
+    re.compile(rb"outline:\s*0"),
+]
+CLICKABLE_RE = re.compile(rb"<(div|span)([^>]*)onClick[^>]*>")
+LINK_RE = re.compile(rb"<a[^>]*>(.*?)</a>", re.IGNORECASE)
+SINGLE_TAG_RE = re.compile(r"^<[^>]+>$")
+TAG_STRIP_RE = re.compile(r"<[^>]+>")
+AMBIGUOUS_LINK_TEXTS = frozenset(["click here", "read more", "here", "more", "link"])
+AMBIGUOUS_LINK_MAX_LEN = max(map(len, AMBIGUOUS_LINK_TEXTS))
+ONCLICK_HANDLER_RE = re.compile(r"onClick=\{([^}]+)\}")
+STYLE_COLOR_RES = {
+    "color": re.compile(r"color:\s*[\"']?([^\"'\s,}]+)"),
+    "background": re.compile(r"background:\s*[\"']?([^\"'\s,}]+)"),
+}
+# #rgb, #rrggbb, or #rrggbbaa (alpha is ignored for contrast)
+HEX_COLOR_RE = re.compile(r"#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6}(?:[0-9a-fA-F]{2})?)")
+FOCUS_STYLE_RE = re.compile(rb":focus|focus-visible")
+MODAL_CONTEXT_RE = re.compile(rb"modal|dialog", re.IGNORECASE)
+
+# Common ARIA typos and the attribute that was meant
+INVALID_ARIA_ATTRIBUTES = {
+    "aria-labelled-by": "aria-labelledby",
+    "aria-described-by": "aria-describedby",
+}
+INVALID_ARIA_RE = re.compile(
+    b"|".join(re.escape(attr.encode()) for attr in INVALID_ARIA_ATTRIBUTES)
+)
+
+# Source files picked up by --recursive, and directories it never descends into
+COMPONENT_EXTENSIONS = (".tsx", ".jsx", ".vue", ".svelte", ".ts", ".js")
+SKIP_DIRS = frozenset({"node_modules", ".git", "dist", "build", "coverage"})
+
+# Persistent result cache for --recursive re-runs
+CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "storybook-assistant"
+    / "a11y-analysis.db"
+)
+
+# Below this many uncached files, worker start-up costs more than it saves
+PARALLEL_MIN_FILES = 8
+
+# Below this many color pairs NumPy's call overhead outweighs the scalar loop
+NUMPY_BATCH_MIN = 16
+
+# JSON output helper shared with the other skill scripts
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "shared"))
+from json_output import write_json  # noqa: E402
+
+# Every rule match starts with one of these prefixes, so a single scan over the
+# content finds all candidate positions; the handler for each group then runs
+# the full rule patterns anchored at that position. Each group also lists the
+# literals its rules need in order to report anything (any one is enough).
+LINK_CLOSE_NEEDLES = (b"</a>", b"</A>")
+SCAN_PREFIXES = [
+    ("button", rb"<button", (b"<button",)),
+    ("img", rb"<img", (b"<img",)),
+    ("input", rb"<input", (b"<input",)),
+    ("style", rb"style=\{\{", (b"style={{",)),
+    ("clickable", rb"<(?:div|span)", (b"onClick",)),
+    ("heading", rb"<h[1-6]", tuple(b"<h%d" % level for level in range(1, 7))),
+    ("landmark", rb"<(?:nav|main|aside)", (b'role="', *LINK_CLOSE_NEEDLES)),
+    ("link", rb"<[aA]", LINK_CLOSE_NEEDLES),
+    ("focus", rb"outline:", (b"outline:",)),
+    (
+        "invalid_aria",
+        INVALID_ARIA_RE.pattern,
+        tuple(attr.encode() for attr in INVALID_ARIA_ATTRIBUTES),
+    ),
+]
+SCAN_RE = re.compile(
+    b"|".join(
+        b"(?P<%s>%s)" % (group.encode(), prefix) for group, prefix, _ in SCAN_PREFIXES
+    )
+)
+
+# Files containing none of the groups' literals (plain .ts/.js modules, markup
+# without a11y hazards) can't produce an issue, so they skip the scan entirely
+PRESCREEN_NEEDLES = tuple(
+    dict.fromkeys(needle for _, _, needles in SCAN_PREFIXES for needle in needles)
+)
+
+
+def _compile_scan_database():
+    """Compile SCAN_PREFIXES into a Hyperscan database, if Hyperscan is available"""
+    if hyperscan is None:
+        return None
+
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[prefix for _, prefix, _ in SCAN_PREFIXES],
+        ids=list(range(len(SCAN_PREFIXES))),
+        elements=len(SCAN_PREFIXES),
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(SCAN_PREFIXES),
+    )
+    return database
+
+
+SCAN_DATABASE = _compile_scan_database()
+
+# Report order of issue types (matches the order checks are documented in)
+CHECK_ORDER = {
+    issue_type: rank
+    for rank, issue_type in enumerate(
+        [
+            "missing_accessible_name",
+            "missing_alt_text",
+            "missing_form_label",
+            "color_contrast",
+            "redundant_aria_role",
+            "invalid_aria_attribute",
+            "missing_focus_indicator",
+            "missing_keyboard_support",
+            "heading_hierarchy_skip",
+            "ambiguous_link_text",
+        ]
+    )
+}
+
+
+@lru_cache(maxsize=None)
+def _attr_value_patterns(attr_name: str) -> Tuple[re.Pattern, re.Pattern]:
+    """Compiled quoted and braced value patterns for an attribute name"""
+    return (
+        re.compile(f"{attr_name}=([\"'])([^\"']*?)\\1"),
+        re.compile(f"{attr_name}={{([^}}]+)}}"),
+    )
+
+
+def _text(data: bytes) -> str:
+    """Decode a matched byte payload for string checks and reporting"""
+    return data.decode("utf-8", "replace")
+
+
+@lru_cache(maxsize=1024)
+def hex_to_rgb(color: str) -> Tuple[int, int, int]:
+    """Convert a #rgb or #rrggbb color to an (r, g, b) tuple"""
+    color = color.lstrip("#")
+    if len(color) == 3:
+        color = "".join([c * 2 for c in color])
+    return tuple(int(color[i : i + 2], 16) for i in (0, 2, 4))
+
+
+def luminance(rgb: Tuple[int, int, int]) -> float:
+    """Simplified WCAG relative luminance of an (r, g, b) tuple"""
+    r, g, b = [c / 255.0 for c in rgb]
+    r = r / 12.92 if r <= 0.03928 else ((r + 0.055) / 1.055) ** 2.4
+    g = g / 12.92 if g <= 0.03928 else ((g + 0.055) / 1.055) ** 2.4
+    b = b / 12.92 if b <= 0.03928 else ((b + 0.055) / 1.055) ** 2.4
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+@lru_cache(maxsize=4096)
+def contrast_ratio(fg: str, bg: str) -> float:
+    """Calculate WCAG contrast ratio between two colors"""
+    # Simplified contrast calculation (would use full algorithm in production)
+    # This is a placeholder that returns approximate values
+
+    # For non-hex colors (rgb(), var(--x), names), return a default passing
+    # value; checked up front so the common case never raises
+    if not (HEX_COLOR_RE.fullmatch(fg) and HEX_COLOR_RE.fullmatch(bg)):
+        return 5.0
+
+    l1 = luminance(hex_to_rgb(fg))
+    l2 = luminance(hex_to_rgb(bg))
+
+    lighter = max(l1, l2)
+    darker = min(l1, l2)
+
+    return (lighter + 0.05) / (darker + 0.05)
+
 
 class Severity(Enum):
     """Issue severity levels matching WCAG conformance"""
@@ -36,7 +246,7 @@ class WCAGLevel(Enum):
     AAA = "AAA"
 
 
-@dataclass
+@dataclass(slots=True)
 class AccessibilityIssue:
     """Represents a single accessibility violation"""
 
@@ -52,448 +262,649 @@ class AccessibilityIssue:
     fix_suggestions: List[Dict[str, Any]]
 
     def to_dict(self):
-        """Convert to dictionary for JSON serialization"""
+        """Convert to dictionary for JSON serialization
+
+        Built field by field rather than with asdict(), which deep-copies the
+        context and fix_suggestions containers of every issue.
+        """
         return {
-            **asdict(self),
+            "type": self.type,
             "severity": self.severity.value,
+            "wcag_criterion": self.wcag_criterion,
             "wcag_level": self.wcag_level.value,
+            "line": self.line,
+            "column": self.column,
+            "element": self.element,
+            "message": self.message,
+            "context": self.context,
+            "fix_suggestions": self.fix_suggestions,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AccessibilityIssue":
+        """Rebuild an issue from its to_dict() form"""
+        return cls(
+            **{
+                **data,
+                "severity": Severity(data["severity"]),
+                "wcag_level": WCAGLevel(data["wcag_level"]),
+            }
+        )
+
+
+class AnalysisCache:
+    """On-disk cache of analysis results for unchanged files
+
+    Rows are keyed by absolute path and are only reused while the file's
+    mtime and size match, and the analyzer script itself is unchanged (so
+    editing a rule invalidates every cached result). Writes are buffered and
+    committed in one batch by close().
+    """
+
+    def __init__(self, db_path: Path = CACHE_PATH):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, "
+            "analyzer TEXT, issues_json BLOB)"
+        )
+        analyzer_stat = os.stat(__file__)
+        self.analyzer = f"{analyzer_stat.st_mtime_ns}:{analyzer_stat.st_size}"
+        self._pending: List[Tuple[str, int, int, str, str]] = []
+
+    @classmethod
+    def open(cls, db_path: Path = CACHE_PATH) -> Optional["AnalysisCache"]:
+        """Open the cache, or return None if it can't be created"""
+        try:
+            return cls(db_path)
+        except (OSError, sqlite3.Error):
+            return None
+
+    def get(self, path: str, st: os.stat_result) -> Optional[List[AccessibilityIssue]]:
+        """Return cached issues for path if it is unchanged since they were stored"""
+        row = self.conn.execute(
+            "SELECT mtime, size, analyzer, issues_json FROM results WHERE path = ?",
+            (os.path.abspath(path),),
+        ).fetchone()
+        if row is None or row[:3] != (st.st_mtime_ns, st.st_size, self.analyzer):
+            return None
+        return [AccessibilityIssue.from_dict(issue) for issue in json.loads(row[3])]
+
+    def has(self, path: str, st: os.stat_result) -> bool:
+        """Whether get() would hit for path, without decoding the stored issues"""
+        row = self.conn.execute(
+            "SELECT mtime, size, analyzer FROM results WHERE path = ?",
+            (os.path.abspath(path),),
+        ).fetchone()
+        return row == (st.st_mtime_ns, st.st_size, self.analyzer)
+
+    def put(self, path: str, st: os.stat_result, issues: List[AccessibilityIssue]):
+        """Queue issues for path to be written on close()"""
+        self._pending.append(
+            (
+                os.path.abspath(path),
+                st.st_mtime_ns,
+                st.st_size,
+                self.analyzer,
+                json.dumps([issue.to_dict() for issue in issues]),
+            )
+        )
+
+    def close(self):
+        """Write queued results in one transaction and close the database"""
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                    self._pending,
+                )
+        except sqlite3.Error:
+            # A cache that can't be written only costs a re-analysis next run
+            pass
+        finally:
+            self.conn.close()
+
 
 class ComponentAnalyzer:
     """Main analyzer for component accessibility"""
 
     def __init__(self, file_path: str):
         self.file_path = Path(file_path)
-        self.content = self.file_path.read_text()
-        self.lines = self.content.split("\n")
+        # Kept as bytes: every rule is ASCII-level, so the file is never decoded
+        # as a whole, only the matched payloads that end up in issues
+        self.content = self.file_path.read_bytes()
+        self._ascii = self.content.isascii()
+        self.lines = self.content.split(b"\n")
         self.issues: List[AccessibilityIssue] = []
 
+        # Running line count at a content offset, advanced by _locate
+        self._cursor = 0
+        self._cursor_line = 1
+
+        # End of the last match per rule pattern, so rules never overlap themselves
+        self._resume: Dict[re.Pattern, int] = {}
+        self._prev_heading_level = 0
+        self._color_pairs: List[Tuple[re.Match, str, str]] = []
+
+    def _locate(self, pos: int) -> Tuple[int, int]:
+        """Translate a content offset into a 1-based (line, column) pair
+
+        Offsets arrive in increasing order during a scan, so only the newlines
+        between the previous offset and this one are counted (bytes.count scans
+        the existing buffer without slicing it). Columns count characters, not
+        bytes.
+        """
+        if pos >= self._cursor:
+            self._cursor_line += self.content.count(b"\n", self._cursor, pos)
+        else:
+            self._cursor_line -= self.content.count(b"\n", pos, self._cursor)
+        self._cursor = pos
+
+        line_start = self.content.rfind(b"\n", 0, pos) + 1
+        line_prefix = self.content[line_start:pos]
+        if not line_prefix.isascii():
+            line_prefix = _text(line_prefix)
+        return self._cursor_line, len(line_prefix) + 1
+
+    def _shift(self, pos: int, chars: int) -> int:
+        """Move a content offset by chars characters (backwards if negative)
+
+        Context windows are sized in characters, as they were when the file was
+        read as text; outside ASCII a character can span several bytes.
+        """
+        if self._ascii:
+            return min(max(0, pos + chars), len(self.content))
+
+        # A character is at most 4 bytes, so the window always holds enough of
+        # them; surrogateescape keeps the byte count exact for invalid UTF-8
+        if chars >= 0:
+            ahead = self.content[pos : pos + 4 * chars]
+            ahead = ahead.decode("utf-8", "surrogateescape")[:chars]
+            return pos + len(ahead.encode("utf-8", "surrogateescape"))
+        behind = self.content[max(0, pos + 4 * chars) : pos]
+        behind = behind.decode("utf-8", "surrogateescape")[chars:]
+        return pos - len(behind.encode("utf-8", "surrogateescape"))
+
     def analyze(self) -> List[AccessibilityIssue]:
-        """Run all accessibility checks"""
-        self.check_missing_button_labels()
-        self.check_missing_img_alt()
-        self.check_missing_form_labels()
-        self.check_color_contrast()
-        self.check_redundant_aria()
-        self.check_invalid_aria_attributes()
-        self.check_missing_focus_indicators()
-        self.check_keyboard_accessibility()
-        self.check_heading_hierarchy()
-        self.check_link_purpose()
+        """Run all accessibility checks in a single pass over the content"""
+        if not any(needle in self.content for needle in PRESCREEN_NEEDLES):
+            return self.issues
+
+        for group, pos in self._scan():
+            getattr(self, "_handle_" + group)(pos)
+        self._flush_color_contrast()
 
+        # Report issues grouped by check, in document order within each check
+        self.issues.sort(key=lambda issue: CHECK_ORDER[issue.type])
         return self.issues
 
-    def check_missing_button_labels(self):
+    def _scan(self) -> Iterator[Tuple[str, int]]:
+        """Yield (group, offset) for every rule prefix in the content, in order"""
+        if SCAN_DATABASE is None:
+            for match in SCAN_RE.finditer(self.content):
+                yield match.lastgroup, match.start()
+            return
+
+        # Prefixes can overlap (<aside is also <a); keep the first group per
+        # offset, as the SCAN_RE alternation would
+        hits: Dict[int, int] = {}
+
+        def on_match(prefix_id, start, end, flags, context):
+            if prefix_id < hits.get(start, len(SCAN_PREFIXES)):
+                hits[start] = prefix_id
+
+        SCAN_DATABASE.scan(self.content, match_event_handler=on_match)
+        for start in sorted(hits):
+            yield SCAN_PREFIXES[hits[start]][0], start
+
+    def _match_at(self, pattern: re.Pattern, pos: int) -> Optional[re.Match]:
+        """Match a rule pattern at pos unless it overlaps that rule's last match"""
+        if pos < self._resume.get(pattern, 0):
+            return None
+        match = pattern.match(self.content, pos)
+        if match:
+            self._resume[pattern] = match.end()
+        return match
+
+    # Scan dispatch: one handler per SCAN_RE group
+
+    def _handle_button(self, pos: int):
+        self.check_missing_button_labels(pos)
+        self.check_redundant_aria(pos)
+
+    def _handle_img(self, pos: int):
+        self.check_missing_img_alt(pos)
+
+    def _handle_input(self, pos: int):
+        self.check_missing_form_labels(pos)
+
+    def _handle_style(self, pos: int):
+        self.check_color_contrast(pos)
+
+    def _handle_clickable(self, pos: int):
+        self.check_keyboard_accessibility(pos)
+
+    def _handle_heading(self, pos: int):
+        self.check_heading_hierarchy(pos)
+
+    def _handle_landmark(self, pos: int):
+        self.check_redundant_aria(pos)
+        # <aside also opens a potential <a ...> match
+        self.check_link_purpose(pos)
+
+    def _handle_link(self, pos: int):
+        self.check_link_purpose(pos)
+
+    def _handle_focus(self, pos: int):
+        self.check_missing_focus_indicators(pos)
+
+    def _handle_invalid_aria(self, pos: int):
+        self.check_invalid_aria_attributes(pos)
+
+    def check_missing_button_labels(self, pos: int):
         """WCAG 4.1.2: Check for buttons without accessible names"""
         # Match <button> elements
-        button_pattern = r"<button([^>]*?)>(.*?)</button>"
-
-        for match in re.finditer(button_pattern, self.content, re.DOTALL):
-            attrs = match.group(1)
-            content = match.group(2).strip()
-            line_num = self.content[: match.start()].count("\n") + 1
-
-            # Check if button has accessible name
-            has_aria_label = "aria-label=" in attrs
-            has_aria_labelledby = "aria-labelledby=" in attrs
-            has_title = "title=" in attrs
-            has_text_content = bool(content and not re.match(r"^<[^>]+>$", content))
-
-            # Special check for icon-only buttons (×, ✕, icons)
-            is_icon_only = (
-                content in ["×", "✕", "X", ""]
-                or "<Icon" in content
-                or "<svg" in content
-            )
+        match = self._match_at(BUTTON_RE, pos)
+        if not match:
+            return
 
-            if not (
-                has_aria_label or has_aria_labelledby or has_title or has_text_content
-            ):
-                # Infer button purpose from context
-                context = self._infer_button_context(attrs, content, line_num)
+        attrs = _text(match.group(1))
+        content = _text(match.group(2)).strip()
+        line_num, column = self._locate(match.start())
 
-                self.issues.append(
-                    AccessibilityIssue(
-                        type="missing_accessible_name",
-                        severity=Severity.ERROR,
-                        wcag_criterion="4.1.2",
-                        wcag_level=WCAGLevel.A,
-                        line=line_num,
-                        column=match.start()
-                        - self.content[: match.start()].rfind("\n"),
-                        element=f"<button>{content}</button>",
-                        message="Button has no accessible name for screen readers",
-                        context={
-                            "button_purpose": context["purpose"],
-                            "is_icon_only": is_icon_only,
-                            "content": content,
-                            "attributes": attrs,
-                        },
-                        fix_suggestions=self._generate_button_fixes(content, context),
-                    )
+        # Check if button has accessible name
+        has_aria_label = "aria-label=" in attrs
+        has_aria_labelledby = "aria-labelledby=" in attrs
+        has_title = "title=" in attrs
+        has_text_content = bool(content and not SINGLE_TAG_RE.match(content))
+
+        # Special check for icon-only buttons (×, ✕, icons)
+        is_icon_only = (
+            content in ["×", "✕", "X", ""] or "<Icon" in content or "<svg" in content
+        )
+
+        if not (has_aria_label or has_aria_labelledby or has_title or has_text_content):
+            # Infer button purpose from context
+            context = self._infer_button_context(attrs, content, line_num)
+
+            self.issues.append(
+                AccessibilityIssue(
+                    type="missing_accessible_name",
+                    severity=Severity.ERROR,
+                    wcag_criterion="4.1.2",
+                    wcag_level=WCAGLevel.A,
+                    line=line_num,
+                    column=column,
+                    element=f"<button>{content}</button>",
+                    message="Button has no accessible name for screen readers",
+                    context={
+                        "button_purpose": context["purpose"],
+                        "is_icon_only": is_icon_only,
+                        "content": content,
+                        "attributes": attrs,
+                    },
+                    fix_suggestions=self._generate_button_fixes(content, context),
                 )
+            )
 
-    def check_missing_img_alt(self):
+    def check_missing_img_alt(self, pos: int):
         """WCAG 1.1.1: Check for images without alt text"""
-        img_pattern = r"<img\s+([^>]*?)/?>"
+        match = self._match_at(IMG_RE, pos)
+        if not match:
+            return
 
-        for match in re.finditer(img_pattern, self.content):
-            attrs = match.group(1)
-            line_num = self.content[: match.start()].count("\n") + 1
+        attrs = _text(match.group(1))
+        line_num, column = self._locate(match.start())
+
+        # Check for alt attribute
+        has_alt = "alt=" in attrs
+
+        if not has_alt:
+            # Check if image is decorative
+            is_decorative = self._is_decorative_image(attrs)
+
+            self.issues.append(
+                AccessibilityIssue(
+                    type="missing_alt_text",
+                    severity=Severity.ERROR,
+                    wcag_criterion="1.1.1",
+                    wcag_level=WCAGLevel.A,
+                    line=line_num,
+                    column=column,
+                    element=_text(match.group(0)),
+                    message="Image missing alt attribute",
+                    context={
+                        "is_decorative": is_decorative,
+                        "src": self._extract_attr_value(attrs, "src"),
+                        "className": self._extract_attr_value(attrs, "className"),
+                    },
+                    fix_suggestions=self._generate_img_fixes(attrs, is_decorative),
+                )
+            )
 
-            # Check for alt attribute
-            has_alt = "alt=" in attrs
+    def check_missing_form_labels(self, pos: int):
+        """WCAG 3.3.2: Check for form inputs without labels"""
+        match = self._match_at(INPUT_RE, pos)
+        if not match:
+            return
 
-            if not has_alt:
-                # Check if image is decorative
-                is_decorative = self._is_decorative_image(attrs)
+        attrs = _text(match.group(1))
+        line_num, column = self._locate(match.start())
 
-                self.issues.append(
-                    AccessibilityIssue(
-                        type="missing_alt_text",
-                        severity=Severity.ERROR,
-                        wcag_criterion="1.1.1",
-                        wcag_level=WCAGLevel.A,
-                        line=line_num,
-                        column=match.start()
-                        - self.content[: match.start()].rfind("\n"),
-                        element=match.group(0),
-                        message="Image missing alt attribute",
-                        context={
-                            "is_decorative": is_decorative,
-                            "src": self._extract_attr_value(attrs, "src"),
-                            "className": self._extract_attr_value(attrs, "className"),
-                        },
-                        fix_suggestions=self._generate_img_fixes(attrs, is_decorative),
-                    )
-                )
+        # Check if input has label association
+        has_id = "id=" in attrs
+        has_aria_label = "aria-label=" in attrs
+        has_aria_labelledby = "aria-labelledby=" in attrs
+        input_type = self._extract_attr_value(attrs, "type") or "text"
+
+        # Check if there's a <label htmlFor="..."> nearby
+        has_external_label = False
+        if has_id:
+            input_id = self._extract_attr_value(attrs, "id")
+            has_external_label = (
+                f'htmlFor="{input_id}"'.encode() in self.content
+                or f"htmlFor='{input_id}'".encode() in self.content
+            )
 
-    def check_missing_form_labels(self):
-        """WCAG 3.3.2: Check for form inputs without labels"""
-        input_pattern = r"<input\s+([^>]*?)/?>"
-
-        for match in re.finditer(input_pattern, self.content):
-            attrs = match.group(1)
-            line_num = self.content[: match.start()].count("\n") + 1
-
-            # Check if input has label association
-            has_id = "id=" in attrs
-            has_aria_label = "aria-label=" in attrs
-            has_aria_labelledby = "aria-labelledby=" in attrs
-            input_type = self._extract_attr_value(attrs, "type") or "text"
-
-            # Check if there's a <label htmlFor="..."> nearby
-            has_external_label = False
-            if has_id:
-                input_id = self._extract_attr_value(attrs, "id")
-                has_external_label = (
-                    f'htmlFor="{input_id}"' in self.content
-                    or f"htmlFor='{input_id}'" in self.content
+        if not (has_aria_label or has_aria_labelledby or has_external_label):
+            # Hidden inputs don't need labels
+            if input_type == "hidden":
+                return
+
+            placeholder = self._extract_attr_value(attrs, "placeholder")
+
+            self.issues.append(
+                AccessibilityIssue(
+                    type="missing_form_label",
+                    severity=Severity.ERROR,
+                    wcag_criterion="3.3.2",
+                    wcag_level=WCAGLevel.A,
+                    line=line_num,
+                    column=column,
+                    element=_text(match.group(0)),
+                    message="Form input missing associated label",
+                    context={
+                        "input_type": input_type,
+                        "placeholder": placeholder,
+                        "has_id": has_id,
+                    },
+                    fix_suggestions=self._generate_input_fixes(
+                        attrs, input_type, placeholder
+                    ),
                 )
+            )
+
+    def check_color_contrast(self, pos: int):
+        """WCAG 1.4.3: Check for color contrast issues"""
+        # Look for inline styles with color definitions
+        match = self._match_at(STYLE_RE, pos)
+        if not match:
+            return
+
+        styles = _text(match.group(1))
 
-            if not (has_aria_label or has_aria_labelledby or has_external_label):
-                # Hidden inputs don't need labels
-                if input_type == "hidden":
-                    continue
+        # Extract color and background
+        color = self._extract_style_color(styles, "color")
+        background = self._extract_style_color(styles, "background")
+
+        # Ratios are computed for all pairs at once after the scan
+        if color and background:
+            self._color_pairs.append((match, color, background))
+
+    def _flush_color_contrast(self):
+        """Report low-contrast color pairs collected during the scan"""
+        contrast_ratios = self._calculate_contrast_ratios(
+            [(color, background) for _, color, background in self._color_pairs]
+        )
 
-                placeholder = self._extract_attr_value(attrs, "placeholder")
+        for (match, color, background), contrast_ratio in zip(
+            self._color_pairs, contrast_ratios
+        ):
+            # Check WCAG levels
+            passes_aa_normal = contrast_ratio >= 4.5
+            passes_aa_large = contrast_ratio >= 3.0
+            passes_aaa_normal = contrast_ratio >= 7.0
+
+            if not passes_aa_normal:
+                line_num, column = self._locate(match.start())
 
                 self.issues.append(
                     AccessibilityIssue(
-                        type="missing_form_label",
-                        severity=Severity.ERROR,
-                        wcag_criterion="3.3.2",
-                        wcag_level=WCAGLevel.A,
+                        type="color_contrast",
+                        severity=Severity.ERROR
+                        if not passes_aa_large
+                        else Severity.WARNING,
+                        wcag_criterion="1.4.3",
+                        wcag_level=WCAGLevel.AA,
                         line=line_num,
-                        column=match.start()
-                        - self.content[: match.start()].rfind("\n"),
-                        element=match.group(0),
-                        message="Form input missing associated label",
+                        column=column,
+                        element=_text(match.group(0)),
+                        message=f"Color contrast too low ({contrast_ratio:.1f}:1)",
                         context={
-                            "input_type": input_type,
-                            "placeholder": placeholder,
-                            "has_id": has_id,
+                            "foreground_color": color,
+                            "background_color": background,
+                            "contrast_ratio": contrast_ratio,
+                            "passes_aa_normal": passes_aa_normal,
+                            "passes_aa_large": passes_aa_large,
+                            "passes_aaa": passes_aaa_normal,
                         },
-                        fix_suggestions=self._generate_input_fixes(
-                            attrs, input_type, placeholder
+                        fix_suggestions=self._generate_contrast_fixes(
+                            color, background, contrast_ratio
                         ),
                     )
                 )
 
-    def check_color_contrast(self):
-        """WCAG 1.4.3: Check for color contrast issues"""
-        # Look for inline styles with color definitions
-        style_pattern = r"style=\{\{([^}]+)\}\}"
-
-        for match in re.finditer(style_pattern, self.content):
-            styles = match.group(1)
-            line_num = self.content[: match.start()].count("\n") + 1
-
-            # Extract color and background
-            color = self._extract_style_color(styles, "color")
-            background = self._extract_style_color(styles, "background")
-
-            if color and background:
-                contrast_ratio = self._calculate_contrast_ratio(color, background)
-
-                # Check WCAG levels
-                passes_aa_normal = contrast_ratio >= 4.5
-                passes_aa_large = contrast_ratio >= 3.0
-                passes_aaa_normal = contrast_ratio >= 7.0
-
-                if not passes_aa_normal:
-                    self.issues.append(
-                        AccessibilityIssue(
-                            type="color_contrast",
-                            severity=Severity.ERROR
-                            if not passes_aa_large
-                            else Severity.WARNING,
-                            wcag_criterion="1.4.3",
-                            wcag_level=WCAGLevel.AA,
-                            line=line_num,
-                            column=match.start()
-                            - self.content[: match.start()].rfind("\n"),
-                            element=match.group(0),
-                            message=f"Color contrast too low ({contrast_ratio:.1f}:1)",
-                            context={
-                                "foreground_color": color,
-                                "background_color": background,
-                                "contrast_ratio": contrast_ratio,
-                                "passes_aa_normal": passes_aa_normal,
-                                "passes_aa_large": passes_aa_large,
-                                "passes_aaa": passes_aaa_normal,
-                            },
-                            fix_suggestions=self._generate_contrast_fixes(
-                                color, background, contrast_ratio
-                            ),
-                        )
-                    )
-
-    def check_redundant_aria(self):
+    def check_redundant_aria(self, pos: int):
         """WCAG 4.1.2: Check for redundant ARIA roles"""
-        redundant_patterns = [
-            (r'<button[^>]*role="button"', "button", "button"),
-            (r'<nav[^>]*role="navigation"', "nav", "navigation"),
-            (r'<main[^>]*role="main"', "main", "main"),
-            (r'<aside[^>]*role="complementary"', "aside", "complementary"),
-        ]
-
-        for pattern, element, role in redundant_patterns:
-            for match in re.finditer(pattern, self.content):
-                line_num = self.content[: match.start()].count("\n") + 1
-
-                self.issues.append(
-                    AccessibilityIssue(
-                        type="redundant_aria_role",
-                        severity=Severity.INFO,
-                        wcag_criterion="4.1.2",
-                        wcag_level=WCAGLevel.A,
-                        line=line_num,
-                        column=match.start()
-                        - self.content[: match.start()].rfind("\n"),
-                        element=match.group(0),
-                        message=f'Redundant role="{role}" on <{element}> element',
-                        context={"element": element, "redundant_role": role},
-                        fix_suggestions=[
-                            {
-                                "rank": 1,
-                                "method": "remove_redundant_role",
-                                "description": f'Remove role="{role}" (native <{element}> already provides this role)',
-                                "code": match.group(0)
-                                .replace(f'role="{role}"', "")
-                                .replace("  ", " "),
-                            }
-                        ],
-                    )
+        for pattern, element, role in REDUNDANT_RES:
+            match = self._match_at(pattern, pos)
+            if not match:
+                continue
+
+            line_num, column = self._locate(match.start())
+
+            self.issues.append(
+                AccessibilityIssue(
+                    type="redundant_aria_role",
+                    severity=Severity.INFO,
+                    wcag_criterion="4.1.2",
+                    wcag_level=WCAGLevel.A,
+                    line=line_num,
+                    column=column,
+                    element=_text(match.group(0)),
+                    message=f'Redundant role="{role}" on <{element}> element',
+                    context={"element": element, "redundant_role": role},
+                    fix_suggestions=[
+                        {
+                            "rank": 1,
+                            "method": "remove_redundant_role",
+                            "description": f'Remove role="{role}" (native <{element}> already provides this role)',
+                            "code": _text(match.group(0))
+                            .replace(f'role="{role}"', "")
+                            .replace("  ", " "),
+                        }
+                    ],
                 )
+            )
 
-    def check_invalid_aria_attributes(self):
+    def check_invalid_aria_attributes(self, pos: int):
         """Check for invalid or misspelled ARIA attributes"""
-        # Common ARIA typos
-        invalid_aria = [
-            "aria-labelled-by",  # Should be aria-labelledby
-            "aria-described-by",  # Should be aria-describedby
-        ]
+        match = self._match_at(INVALID_ARIA_RE, pos)
+        if not match:
+            return
 
-        for invalid in invalid_aria:
-            if invalid in self.content:
-                for match in re.finditer(invalid, self.content):
-                    line_num = self.content[: match.start()].count("\n") + 1
-                    correct = invalid.replace("-", "")
-
-                    self.issues.append(
-                        AccessibilityIssue(
-                            type="invalid_aria_attribute",
-                            severity=Severity.ERROR,
-                            wcag_criterion="4.1.2",
-                            wcag_level=WCAGLevel.A,
-                            line=line_num,
-                            column=match.start()
-                            - self.content[: match.start()].rfind("\n"),
-                            element=invalid,
-                            message=f"Invalid ARIA attribute: {invalid}",
-                            context={"invalid_attr": invalid, "correct_attr": correct},
-                            fix_suggestions=[
-                                {
-                                    "rank": 1,
-                                    "method": "fix_typo",
-                                    "description": f"Correct attribute name to {correct}",
-                                    "code": f"Replace {invalid} with {correct}",
-                                }
-                            ],
-                        )
-                    )
+        invalid = _text(match.group(0))
+        correct = INVALID_ARIA_ATTRIBUTES[invalid]
+        line_num, column = self._locate(match.start())
+
+        self.issues.append(
+            AccessibilityIssue(
+                type="invalid_aria_attribute",
+                severity=Severity.ERROR,
+                wcag_criterion="4.1.2",
+                wcag_level=WCAGLevel.A,
+                line=line_num,
+                column=column,
+                element=invalid,
+                message=f"Invalid ARIA attribute: {invalid}",
+                context={"invalid_attr": invalid, "correct_attr": correct},
+                fix_suggestions=[
+                    {
+                        "rank": 1,
+                        "method": "fix_typo",
+                        "description": f"Correct attribute name to {correct}",
+                        "code": f"Replace {invalid} with {correct}",
+                    }
+                ],
+            )
+        )
 
-    def check_missing_focus_indicators(self):
+    def check_missing_focus_indicators(self, pos: int):
         """WCAG 2.4.7: Check for removed focus indicators"""
-        focus_removal_patterns = [
-            r'outline:\s*["\']?none["\']?',
-            r"outline:\s*0",
-        ]
-
-        for pattern in focus_removal_patterns:
-            for match in re.finditer(pattern, self.content):
-                line_num = self.content[: match.start()].count("\n") + 1
-
-                # Check if there's a custom focus style nearby
-                context_start = max(0, match.start() - 200)
-                context_end = min(len(self.content), match.end() + 200)
-                context = self.content[context_start:context_end]
-
-                has_custom_focus = ":focus" in context or "focus-visible" in context
-
-                if not has_custom_focus:
-                    self.issues.append(
-                        AccessibilityIssue(
-                            type="missing_focus_indicator",
-                            severity=Severity.WARNING,
-                            wcag_criterion="2.4.7",
-                            wcag_level=WCAGLevel.AA,
-                            line=line_num,
-                            column=match.start()
-                            - self.content[: match.start()].rfind("\n"),
-                            element=match.group(0),
-                            message="Focus outline removed without custom replacement",
-                            context={"has_custom_focus": has_custom_focus},
-                            fix_suggestions=self._generate_focus_fixes(),
-                        )
-                    )
-
-    def check_keyboard_accessibility(self):
-        """WCAG 2.1.1: Check for elements with onClick but no keyboard support"""
-        # Find div/span with onClick but no keyboard support
-        clickable_pattern = r"<(div|span)([^>]*)onClick[^>]*>"
-
-        for match in re.finditer(clickable_pattern, self.content):
-            element_type = match.group(1)
-            attrs = match.group(2)
-            line_num = self.content[: match.start()].count("\n") + 1
-
-            has_role = "role=" in attrs
-            has_tabindex = "tabIndex=" in attrs
-            has_onkeydown = "onKeyDown=" in attrs
+        for pattern in FOCUS_REMOVAL_RES:
+            match = self._match_at(pattern, pos)
+            if not match:
+                continue
+
+            line_num, column = self._locate(match.start())
+
+            # Check if there's a custom focus style nearby
+            has_custom_focus = bool(
+                FOCUS_STYLE_RE.search(
+                    self.content,
+                    self._shift(match.start(), -200),
+                    self._shift(match.end(), 200),
+                )
+            )
 
-            # If it's clickable but not keyboard accessible, flag it
-            if not (has_role and has_tabindex and has_onkeydown):
+            if not has_custom_focus:
                 self.issues.append(
                     AccessibilityIssue(
-                        type="missing_keyboard_support",
-                        severity=Severity.ERROR,
-                        wcag_criterion="2.1.1",
-                        wcag_level=WCAGLevel.A,
+                        type="missing_focus_indicator",
+                        severity=Severity.WARNING,
+                        wcag_criterion="2.4.7",
+                        wcag_level=WCAGLevel.AA,
                         line=line_num,
-                        column=match.start()
-                        - self.content[: match.start()].rfind("\n"),
-                        element=match.group(0),
-                        message=f"<{element_type}> with onClick lacks keyboard support",
-                        context={
-                            "element": element_type,
-                            "has_role": has_role,
-                            "has_tabindex": has_tabindex,
-                            "has_onkeydown": has_onkeydown,
-                        },
-                        fix_suggestions=self._generate_keyboard_fixes(element_type),
+                        column=column,
+                        element=_text(match.group(0)),
+                        message="Focus outline removed without custom replacement",
+                        context={"has_custom_focus": has_custom_focus},
+                        fix_suggestions=self._generate_focus_fixes(),
                     )
                 )
 
-    def check_heading_hierarchy(self):
-        """WCAG 1.3.1: Check for proper heading hierarchy"""
-        headings = re.findall(r"<h([1-6])", self.content)
-
-        if not headings:
+    def check_keyboard_accessibility(self, pos: int):
+        """WCAG 2.1.1: Check for elements with onClick but no keyboard support"""
+        # Find div/span with onClick but no keyboard support
+        match = self._match_at(CLICKABLE_RE, pos)
+        if not match:
             return
 
-        prev_level = 0
-        for i, level_str in enumerate(headings):
-            level = int(level_str)
-
-            # Check if heading level skips (e.g., h2 → h4)
-            if prev_level > 0 and level > prev_level + 1:
-                # Find line number of this heading
-                heading_matches = list(re.finditer(r"<h[1-6]", self.content))
-                if i < len(heading_matches):
-                    line_num = (
-                        self.content[: heading_matches[i].start()].count("\n") + 1
-                    )
-
-                    self.issues.append(
-                        AccessibilityIssue(
-                            type="heading_hierarchy_skip",
-                            severity=Severity.WARNING,
-                            wcag_criterion="1.3.1",
-                            wcag_level=WCAGLevel.A,
-                            line=line_num,
-                            column=0,
-                            element=f"<h{level}>",
-                            message=f"Heading skips from h{prev_level} to h{level}",
-                            context={"prev_level": prev_level, "current_level": level},
-                            fix_suggestions=[
-                                {
-                                    "rank": 1,
-                                    "method": "fix_hierarchy",
-                                    "description": f"Change to h{prev_level + 1} or ensure h{prev_level + 1} exists before this heading",
-                                    "code": f"<h{prev_level + 1}>",
-                                }
-                            ],
-                        )
-                    )
+        element_type = _text(match.group(1))
+        attrs = _text(match.group(2))
+        line_num, column = self._locate(match.start())
+
+        has_role = "role=" in attrs
+        has_tabindex = "tabIndex=" in attrs
+        has_onkeydown = "onKeyDown=" in attrs
+
+        # If it's clickable but not keyboard accessible, flag it
+        if not (has_role and has_tabindex and has_onkeydown):
+            self.issues.append(
+                AccessibilityIssue(
+                    type="missing_keyboard_support",
+                    severity=Severity.ERROR,
+                    wcag_criterion="2.1.1",
+                    wcag_level=WCAGLevel.A,
+                    line=line_num,
+                    column=column,
+                    element=_text(match.group(0)),
+                    message=f"<{element_type}> with onClick lacks keyboard support",
+                    context={
+                        "element": element_type,
+                        "has_role": has_role,
+                        "has_tabindex": has_tabindex,
+                        "has_onkeydown": has_onkeydown,
+                    },
+                    fix_suggestions=self._generate_keyboard_fixes(element_type),
+                )
+            )
 
-            prev_level = level
+    def check_heading_hierarchy(self, pos: int):
+        """WCAG 1.3.1: Check for proper heading hierarchy"""
+        # Headings arrive in document order, so the previous level is carried
+        # across calls instead of re-scanning for it. The scan prefix is the
+        # whole heading pattern, so the level digit is read straight from pos.
+        prev_level = self._prev_heading_level
+        level = self.content[pos + 2] - ord("0")
+        self._prev_heading_level = level
+
+        # Check if heading level skips (e.g., h2 → h4)
+        if prev_level > 0 and level > prev_level + 1:
+            line_num, _ = self._locate(pos)
+
+            self.issues.append(
+                AccessibilityIssue(
+                    type="heading_hierarchy_skip",
+                    severity=Severity.WARNING,
+                    wcag_criterion="1.3.1",
+                    wcag_level=WCAGLevel.A,
+                    line=line_num,
+                    column=0,
+                    element=f"<h{level}>",
+                    message=f"Heading skips from h{prev_level} to h{level}",
+                    context={"prev_level": prev_level, "current_level": level},
+                    fix_suggestions=[
+                        {
+                            "rank": 1,
+                            "method": "fix_hierarchy",
+                            "description": f"Change to h{prev_level + 1} or ensure h{prev_level + 1} exists before this heading",
+                            "code": f"<h{prev_level + 1}>",
+                        }
+                    ],
+                )
+            )
 
-    def check_link_purpose(self):
+    def check_link_purpose(self, pos: int):
         """WCAG 2.4.4: Check for ambiguous link text"""
-        ambiguous_texts = ["click here", "read more", "here", "more", "link"]
+        match = self._match_at(LINK_RE, pos)
+        if not match:
+            return
 
-        link_pattern = r"<a[^>]*>(.*?)</a>"
+        link_text = _text(match.group(1))
+        if "<" in link_text:
+            link_text = TAG_STRIP_RE.sub("", link_text)
+        link_text = link_text.strip()
 
-        for match in re.finditer(link_pattern, self.content, re.IGNORECASE):
-            link_text = re.sub(r"<[^>]+>", "", match.group(1)).strip().lower()
-            line_num = self.content[: match.start()].count("\n") + 1
+        # Most link text is longer than any ambiguous phrase
+        if len(link_text) > AMBIGUOUS_LINK_MAX_LEN:
+            return
 
-            if link_text in ambiguous_texts:
-                self.issues.append(
-                    AccessibilityIssue(
-                        type="ambiguous_link_text",
-                        severity=Severity.WARNING,
-                        wcag_criterion="2.4.4",
-                        wcag_level=WCAGLevel.A,
-                        line=line_num,
-                        column=match.start()
-                        - self.content[: match.start()].rfind("\n"),
-                        element=match.group(0),
-                        message=f'Link text "{link_text}" is not descriptive',
-                        context={"link_text": link_text},
-                        fix_suggestions=[
-                            {
-                                "rank": 1,
-                                "method": "descriptive_text",
-                                "description": "Use descriptive link text that explains where the link goes",
-                                "code": 'Example: "Read the full article" instead of "Read more"',
-                            }
-                        ],
-                    )
+        link_text = link_text.lower()
+        if link_text in AMBIGUOUS_LINK_TEXTS:
+            line_num, column = self._locate(match.start())
+            self.issues.append(
+                AccessibilityIssue(
+                    type="ambiguous_link_text",
+                    severity=Severity.WARNING,
+                    wcag_criterion="2.4.4",
+                    wcag_level=WCAGLevel.A,
+                    line=line_num,
+                    column=column,
+                    element=_text(match.group(0)),
+                    message=f'Link text "{link_text}" is not descriptive',
+                    context={"link_text": link_text},
+                    fix_suggestions=[
+                        {
+                            "rank": 1,
+                            "method": "descriptive_text",
+                            "description": "Use descriptive link text that explains where the link goes",
+                            "code": 'Example: "Read the full article" instead of "Read more"',
+                        }
+                    ],
                 )
+            )
 
     # Helper methods
 
@@ -507,7 +918,7 @@ class ComponentAnalyzer:
 
         # Check onClick handler
         if "onClick=" in attrs:
-            onclick = re.search(r"onClick=\{([^}]+)\}", attrs)
+            onclick = ONCLICK_HANDLER_RE.search(attrs)
             if onclick:
                 handler_name = onclick.group(1).lower()
                 if "delete" in handler_name:
@@ -520,11 +931,12 @@ class ComponentAnalyzer:
                     return {"purpose": "save_button", "suggested_label": "Save"}
 
         # Check surrounding context
-        context_start = max(0, self.content.rfind("\n", 0, line_num * 80) - 200)
-        context_end = min(len(self.content), line_num * 80 + 200)
-        surrounding = self.content[context_start:context_end].lower()
+        anchor = self._shift(0, line_num * 80)
+        line_start = self.content.rfind(b"\n", 0, anchor)
+        context_start = self._shift(max(0, line_start), -200)
+        context_end = self._shift(anchor, 200)
 
-        if "modal" in surrounding or "dialog" in surrounding:
+        if MODAL_CONTEXT_RE.search(self.content, context_start, context_end):
             return {"purpose": "modal_action", "suggested_label": "Close dialog"}
 
         return {"purpose": "generic_button", "suggested_label": "Action"}
@@ -544,14 +956,13 @@ class ComponentAnalyzer:
 
     def _extract_attr_value(self, attrs: str, attr_name: str) -> Optional[str]:
         """Extract attribute value from attributes string"""
-        pattern = f"{attr_name}=([\"'])([^\"']*?)\\1"
-        match = re.search(pattern, attrs)
+        quoted_pattern, braced_pattern = _attr_value_patterns(attr_name)
+        match = quoted_pattern.search(attrs)
         if match:
             return match.group(2)
 
         # Try without quotes
-        pattern = f"{attr_name}={{([^}}]+)}}"
-        match = re.search(pattern, attrs)
+        match = braced_pattern.search(attrs)
         if match:
             return match.group(1)
 
@@ -559,48 +970,47 @@ class ComponentAnalyzer:
 
     def _extract_style_color(self, styles: str, prop: str) -> Optional[str]:
         """Extract color value from inline styles"""
-        pattern = f"{prop}:\\s*[\"']?([^\"'\\s,}}]+)"
-        match = re.search(pattern, styles)
-        return match.group(1) if match else None
+        match = STYLE_COLOR_RES[prop].search(styles)
+        # Palettes repeat across a design system; share one string per color
+        return sys.intern(match.group(1)) if match else None
 
     def _calculate_contrast_ratio(self, fg: str, bg: str) -> float:
         """Calculate WCAG contrast ratio between two colors"""
-        # Simplified contrast calculation (would use full algorithm in production)
-        # This is a placeholder that returns approximate values
-
-        # Convert hex to RGB if needed
-        def hex_to_rgb(color):
-            color = color.lstrip("#")
-            if len(color) == 3:
-                color = "".join([c * 2 for c in color])
-            return tuple(int(color[i : i + 2], 16) for i in (0, 2, 4))
-
-        def luminance(rgb):
-            # Simplified relative luminance calculation
-            r, g, b = [c / 255.0 for c in rgb]
-            r = r / 12.92 if r <= 0.03928 else ((r + 0.055) / 1.055) ** 2.4
-            g = g / 12.92 if g <= 0.03928 else ((g + 0.055) / 1.055) ** 2.4
-            b = b / 12.92 if b <= 0.03928 else ((b + 0.055) / 1.055) ** 2.4
-            return 0.2126 * r + 0.7152 * g + 0.0722 * b
-
-        try:
-            if fg.startswith("#"):
-                fg_rgb = hex_to_rgb(fg)
-                bg_rgb = hex_to_rgb(bg)
-            else:
-                # For non-hex colors, return a default passing value
-                return 5.0
-
-            l1 = luminance(fg_rgb)
-            l2 = luminance(bg_rgb)
-
-            lighter = max(l1, l2)
-            darker = min(l1, l2)
+        # Design systems reuse a few color tokens, so this is memoized per pair
+        return contrast_ratio(fg, bg)
+
+    def _calculate_contrast_ratios(self, pairs: List[Tuple[str, str]]) -> List[float]:
+        """Calculate contrast ratios for many (fg, bg) pairs, vectorized with NumPy"""
+        if np is None or len(pairs) < NUMPY_BATCH_MIN:
+            return [self._calculate_contrast_ratio(fg, bg) for fg, bg in pairs]
+
+        # Non-hex pairs keep the default passing value, as in
+        # _calculate_contrast_ratio
+        ratios = [5.0] * len(pairs)
+        rows = []
+        rgbs = []
+        for i, (fg, bg) in enumerate(pairs):
+            if not (HEX_COLOR_RE.fullmatch(fg) and HEX_COLOR_RE.fullmatch(bg)):
+                continue
+            rows.append(i)
+            rgbs.extend((hex_to_rgb(fg), hex_to_rgb(bg)))
+
+        if not rows:
+            return ratios
+
+        # Same formula as luminance(); results can differ from the scalar path
+        # only in the last bit of rounding
+        rgb = np.array(rgbs, dtype=np.float64) / 255.0
+        linear = np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+        lum = 0.2126 * linear[:, 0] + 0.7152 * linear[:, 1] + 0.0722 * linear[:, 2]
+        fg_lum, bg_lum = lum[0::2], lum[1::2]
+        contrast = (np.maximum(fg_lum, bg_lum) + 0.05) / (
+            np.minimum(fg_lum, bg_lum) + 0.05
+        )
 
-            return (lighter + 0.05) / (darker + 0.05)
-        except (ValueError, ZeroDivisionError, TypeError):
-            # Color parsing or calculation failed, default to passing contrast
-            return 5.0
+        for i, ratio in zip(rows, contrast.tolist()):
+            ratios[i] = ratio
+        return ratios
 
     def _generate_button_fixes(self, content: str, context: Dict) -> List[Dict]:
         """Generate fix suggestions for button accessible name"""
@@ -792,54 +1202,163 @@ button:focus-visible {
         ]
 
 
+def iter_component_files(root: str) -> Iterator[str]:
+    """Yield component source files under root, walking it with os.scandir
+
+    Suffix and directory checks use the DirEntry data from readdir, so no file
+    is stat'ed. Symlinks and build/dependency directories are skipped.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+
+        subdirs = []
+        for entry in entries:
+            if entry.is_symlink():
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith(COMPONENT_EXTENSIONS):
+                yield entry.path
+
+        # Reversed so directories are visited in name order
+        stack.extend(reversed(subdirs))
+
+
+def analyze_one(path: str) -> List[AccessibilityIssue]:
+    """Analyze one file (module-level so worker processes can run it)"""
+    return ComponentAnalyzer(path).analyze()
+
+
+def analyze_file(
+    path: str, cache: Optional[AnalysisCache] = None
+) -> List[AccessibilityIssue]:
+    """Analyze one file, reusing cached results if it hasn't changed"""
+    if cache is None:
+        return analyze_one(path)
+
+    st = os.stat(path)
+    issues = cache.get(path, st)
+    if issues is None:
+        issues = analyze_one(path)
+        cache.put(path, st, issues)
+    return issues
+
+
+def analyze_tree(
+    root: str, cache: Optional[AnalysisCache] = None
+) -> Iterator[Tuple[str, List[AccessibilityIssue]]]:
+    """Yield (path, issues) for every component file under root, in traversal order
+
+    Files are independent, so uncached ones are analyzed in a process pool
+    (the regex work holds the GIL, which rules out threads). Cache lookups
+    and writes stay in this process. Each file is yielded as soon as its
+    result is available, so only one file's issues are held at a time.
+    """
+    paths = list(iter_component_files(root))
+    stats: Dict[str, os.stat_result] = {}
+    cached = set()
+    pending = []
+
+    for path in paths:
+        if cache is not None:
+            stats[path] = os.stat(path)
+            if cache.has(path, stats[path]):
+                cached.add(path)
+                continue
+        pending.append(path)
+
+    with ExitStack() as stack:
+        if len(pending) < PARALLEL_MIN_FILES:
+            analyzed = map(analyze_one, pending)
+        else:
+            workers = os.cpu_count() or 1
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            # Several small files per task amortizes the pickling round-trips
+            chunksize = max(1, len(pending) // (workers * 4))
+            analyzed = executor.map(analyze_one, pending, chunksize=chunksize)
+
+        for path in paths:
+            if path in cached:
+                issues = cache.get(path, stats[path])
+                if issues is None:
+                    # Another run replaced the row since has() checked it
+                    issues = analyze_one(path)
+                yield path, issues
+                continue
+
+            issues = next(analyzed)
+            if cache is not None:
+                cache.put(path, stats[path], issues)
+            yield path, issues
+
+
+def print_report(file_path: str, issues: List[AccessibilityIssue]):
+    """Print human-readable results for one file"""
+    if not issues:
+        print(f"✓ No accessibility issues found in {file_path}")
+        return
+
+    print(f"\n❌ {len(issues)} accessibility issue(s) found in {file_path}\n")
+
+    for i, issue in enumerate(issues, 1):
+        print(f"{i}. {issue.message}")
+        print(f"   Line {issue.line}: {issue.element}")
+        print(f"   WCAG: {issue.wcag_criterion} (Level {issue.wcag_level.value})")
+        print(f"   Severity: {issue.severity.value.upper()}")
+
+        if issue.fix_suggestions:
+            print("\n   Suggested fixes:")
+            for fix in issue.fix_suggestions[:2]:  # Show top 2
+                print(f"   [{fix['rank']}] {fix['description']}")
+                if "code" in fix:
+                    print(f"       {fix['code'][:60]}...")
+        print()
+
+
 def main():
     """CLI entry point"""
     if len(sys.argv) < 2:
-        print("Usage: python analyze_component.py <component_file> [--json]")
+        print(
+            "Usage: python analyze_component.py <component_file|directory> "
+            "[--json] [--recursive] [--no-cache]"
+        )
         sys.exit(1)
 
     file_path = sys.argv[1]
     output_json = "--json" in sys.argv
+    # --recursive is implied by a directory argument and a no-op for a file
+    recursive = os.path.isdir(file_path)
+    cache = None if "--no-cache" in sys.argv else AnalysisCache.open()
 
     try:
-        analyzer = ComponentAnalyzer(file_path)
-        issues = analyzer.analyze()
-
-        if output_json:
-            # JSON output for programmatic use
-            print(
-                json.dumps(
-                    {
-                        "file": file_path,
-                        "total_issues": len(issues),
-                        "issues": [issue.to_dict() for issue in issues],
-                    },
-                    indent=2,
-                )
-            )
-        else:
-            # Human-readable output
-            if not issues:
-                print(f"✓ No accessibility issues found in {file_path}")
-                return
-
-            print(f"\n❌ {len(issues)} accessibility issue(s) found in {file_path}\n")
-
-            for i, issue in enumerate(issues, 1):
-                print(f"{i}. {issue.message}")
-                print(f"   Line {issue.line}: {issue.element}")
-                print(
-                    f"   WCAG: {issue.wcag_criterion} (Level {issue.wcag_level.value})"
-                )
-                print(f"   Severity: {issue.severity.value.upper()}")
-
-                if issue.fix_suggestions:
-                    print("\n   Suggested fixes:")
-                    for fix in issue.fix_suggestions[:2]:  # Show top 2
-                        print(f"   [{fix['rank']}] {fix['description']}")
-                        if "code" in fix:
-                            print(f"       {fix['code'][:60]}...")
-                print()
+        try:
+            if recursive:
+                results = analyze_tree(file_path, cache)
+            else:
+                results = [(file_path, analyze_file(file_path, cache))]
+
+            # Directory results are written as each file's report is ready
+            for path, issues in results:
+                if output_json:
+                    # JSON output for programmatic use; directories stream one
+                    # record per line (NDJSON) so consumers can parse incrementally
+                    write_json(
+                        {
+                            "file": path,
+                            "total_issues": len(issues),
+                            "issues": [issue.to_dict() for issue in issues],
+                        },
+                        indent=not recursive,
+                    )
+                else:
+                    # Human-readable output
+                    print_report(path, issues)
+        finally:
+            if cache is not None:
+                cache.close()
 
     except FileNotFoundError:
         print(f"Error: File not found: {file_path}")
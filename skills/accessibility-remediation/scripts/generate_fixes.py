@@ -9,24 +9,606 @@ ranked remediation options.
 Usage:
     python generate_fixes.py <component_file> <issue_type>
     python generate_fixes.py Button.tsx missing_accessible_name
+    python generate_fixes.py <report.json> --batch
+
+--batch reads the output of analyze_component.py --json (a single report, or
+NDJSON for a directory) and generates fixes for every issue in one pass.
 """
 
+import re
 import sys
 import json
+from functools import cached_property, lru_cache
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import List, Dict, Any
+from types import MappingProxyType
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple
+
+
+# WCAG criteria and conformance levels repeat across every fix, so each is
+# one interned string shared by all templates and the dicts copied from them
+WCAG_1_1_1 = sys.intern("1.1.1 Non-text Content")
+WCAG_1_3_1 = sys.intern("1.3.1 Info and Relationships")
+WCAG_1_4_3 = sys.intern("1.4.3 Contrast (Minimum)")
+WCAG_2_1_1 = sys.intern("2.1.1 Keyboard")
+WCAG_2_4_4 = sys.intern("2.4.4 Link Purpose (In Context)")
+WCAG_2_4_7 = sys.intern("2.4.7 Focus Visible")
+WCAG_3_3_2 = sys.intern("3.3.2 Labels or Instructions")
+WCAG_4_1_2 = sys.intern("4.1.2 Name, Role, Value")
+WCAG_UNKNOWN = sys.intern("See WCAG 2.2 documentation")
+
+LEVEL_A = sys.intern("A")
+LEVEL_AA = sys.intern("AA")
+LEVEL_AAA = sys.intern("AAA")
+LEVEL_UNKNOWN = sys.intern("Unknown")
+
+# The sr-only utility appended to every icon-button snippet; only the button
+# markup above it varies
+SR_ONLY_CSS = """
+
+/* Add to your global CSS: */
+.sr-only {
+  position: absolute;
+  width: 1px;
+  height: 1px;
+  padding: 0;
+  margin: -1px;
+  overflow: hidden;
+  clip: rect(0, 0, 0, 0);
+  white-space: nowrap;
+  border-width: 0;
+}"""
+
+
+@dataclass(frozen=True, slots=True)
+class FixSuggestion:
+    """A single ranked remediation option for an accessibility issue"""
+
+    rank: int
+    method: str
+    wcag_level: str
+    description: str
+    explanation: str
+    code: str
+    requires: Tuple[str, ...]
+    pros: Tuple[str, ...]
+    cons: Tuple[str, ...]
+    wcag_criterion: str
+    note: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        fix = {
+            "rank": self.rank,
+            "method": self.method,
+            "wcag_level": self.wcag_level,
+            "description": self.description,
+            "explanation": self.explanation,
+            "code": self.code,
+            "requires": list(self.requires),
+            "pros": list(self.pros),
+            "cons": list(self.cons),
+            "wcag_criterion": self.wcag_criterion,
+        }
+        if self.note is not None:
+            fix["note"] = self.note
+        return fix
+
+
+# Focus-style snippets for the two focus fixes
+FOCUS_VISIBLE_CSS = """button {
+  outline: none; /* Remove default outline */
+}
+
+button:focus-visible {
+  outline: 2px solid #2196F3;
+  outline-offset: 2px;
+}"""
+
+CUSTOM_FOCUS_CSS = """button:focus {
+  outline: 2px solid #2196F3;
+  outline-offset: 2px;
+  box-shadow: 0 0 0 3px rgba(33, 150, 243, 0.2);
+}"""
+
+# Keyboard-accessible div/span markup; {element} is the tag, other braces are
+# doubled for str.format_map
+KEYBOARD_HANDLER_TEMPLATE = """<{element}
+  role="button"
+  tabIndex={{0}}
+  onClick={{handleClick}}
+  onKeyDown={{(e) => {{
+    if (e.key === 'Enter' || e.key === ' ') {{
+      e.preventDefault();
+      handleClick();
+    }}
+  }}}}
+>
+  Click me
+</{element}>"""
+
+# Fix templates are built once at import. Placeholders in description,
+# explanation and code are filled per issue with str.format_map (literal
+# braces are doubled). Suggestions are immutable, so fixed ones are shared
+# as-is and filled ones share every unformatted field with their template.
+TEMPLATE_FIELDS = ("description", "explanation", "code")
+
+BUTTON_SR_ONLY_FIX = FixSuggestion(
+    rank=1,
+    method="sr_only_with_icon",
+    wcag_level=LEVEL_AA,
+    description="Add visually hidden text alongside icon",
+    explanation="Best practice for icon buttons - maintains visual design while providing screen reader text",
+    code="{code}",
+    requires=("sr-only CSS class",),
+    pros=(
+        "Maintains visual design",
+        "Clear to screen reader users",
+        "Follows WCAG best practices",
+    ),
+    cons=("Requires sr-only CSS utility class",),
+    wcag_criterion=WCAG_4_1_2,
+)
+
+BUTTON_ARIA_LABEL_FIX = FixSuggestion(
+    rank=1,
+    method="aria_label",
+    wcag_level=LEVEL_AA,
+    description="Add aria-label attribute",
+    explanation="Simple and effective - works immediately without CSS changes",
+    code='<button aria-label="{label}" onClick={{...}}>\n  {content}\n</button>',
+    requires=(),
+    pros=(
+        "Simple implementation",
+        "No CSS required",
+        "Works in all browsers",
+    ),
+    cons=(
+        "Not translatable without additional i18n setup",
+        "Overrides visible text if present",
+    ),
+    wcag_criterion=WCAG_4_1_2,
+)
+
+BUTTON_VISIBLE_TEXT_FIX = FixSuggestion(
+    rank=3,
+    method="visible_text",
+    wcag_level=LEVEL_AAA,
+    description="Replace icon with visible text",
+    explanation="Best for all users - everyone benefits from clear text",
+    code="<button onClick={{...}}>\n  {label}\n</button>",
+    requires=(),
+    pros=(
+        "Clearest for all users",
+        "No screen reader needed",
+        "Best accessibility score",
+    ),
+    cons=("Changes visual design", "Requires more space"),
+    wcag_criterion=WCAG_4_1_2,
+)
+
+BUTTON_TITLE_FIX = FixSuggestion(
+    rank=4,
+    method="title_attribute",
+    wcag_level=LEVEL_A,
+    description="Add title attribute",
+    explanation="Acceptable but not ideal - not announced by all screen readers",
+    code='<button title="{label}" onClick={{...}}>\n  {content}\n</button>',
+    requires=(),
+    pros=("Simple implementation", "Provides tooltip for mouse users"),
+    cons=(
+        "Not announced by all screen readers",
+        "Inconsistent browser support",
+        "Tooltip may not appear on touch devices",
+    ),
+    wcag_criterion=WCAG_4_1_2,
+)
+
+# Context-specific recommendations attached to the top-ranked button fix
+BUTTON_PURPOSE_NOTES = {
+    "close_button": 'For close buttons, "Close" or "Close dialog" are standard labels',
+    "submit_button": 'For submit buttons, be specific: "Submit form", "Save changes", etc.',
+    "delete_button": 'For delete buttons, include what\'s being deleted: "Delete item"',
+}
+
+IMG_EMPTY_ALT_FIX = FixSuggestion(
+    rank=1,
+    method="empty_alt",
+    wcag_level=LEVEL_A,
+    description="Add empty alt attribute for decorative image",
+    explanation="Tells screen readers to skip this image (it's decorative)",
+    code='<img src={...} alt="" aria-hidden="true" />',
+    requires=(),
+    pros=(
+        "Screen readers skip the image",
+        "Cleaner screen reader experience",
+        "Follows WCAG decorative image pattern",
+    ),
+    cons=(),
+    wcag_criterion=WCAG_1_1_1,
+    note='Use empty alt="" for purely decorative images (backgrounds, spacers, visual decoration)',
+)
+
+IMG_DESCRIPTIVE_ALT_FIX = FixSuggestion(
+    rank=1,
+    method="descriptive_alt",
+    wcag_level=LEVEL_A,
+    description="Add descriptive alt text",
+    explanation="Describe what the image shows or its purpose",
+    code='<img src={...} alt="Description of image content" />',
+    requires=(),
+    pros=(
+        "Screen reader users know image content",
+        "Works when images fail to load",
+        "Improves SEO",
+    ),
+    cons=(),
+    wcag_criterion=WCAG_1_1_1,
+    note="Be specific and concise. Describe what's important about the image.",
+)
+
+IMG_LONG_DESCRIPTION_FIX = FixSuggestion(
+    rank=2,
+    method="long_description",
+    wcag_level=LEVEL_AA,
+    description="Add alt text + detailed description",
+    explanation="For complex images like charts, provide both summary and details",
+    code="""<figure>
+  <img src={...} alt="Bar chart showing sales growth" aria-describedby="chart-description" />
+  <figcaption id="chart-description">
+    Detailed description: Sales grew 40% in Q4, from $100K to $140K...
+  </figcaption>
+</figure>""",
+    requires=(),
+    pros=(
+        "Provides both summary and details",
+        "Visible to all users",
+        "Best for complex data visualizations",
+    ),
+    cons=("Requires more markup", "May not fit all designs"),
+    wcag_criterion=WCAG_1_1_1,
+)
+
+FORM_EXPLICIT_LABEL_FIX = FixSuggestion(
+    rank=1,
+    method="explicit_label",
+    wcag_level=LEVEL_AA,
+    description="Add label with htmlFor attribute",
+    explanation="Most robust - works even if elements are separated in the DOM",
+    code="""<label htmlFor="input-id">
+  {label}
+</label>
+<input id="input-id" type="{input_type}" placeholder="{placeholder}" />""",
+    requires=("Unique id on input",),
+    pros=(
+        "Most robust label association",
+        "Works with separated elements",
+        "Clicking label focuses input",
+    ),
+    cons=("Requires unique id",),
+    wcag_criterion=WCAG_3_3_2,
+)
+
+FORM_WRAPPING_LABEL_FIX = FixSuggestion(
+    rank=2,
+    method="wrapping_label",
+    wcag_level=LEVEL_AA,
+    description="Wrap input in label element",
+    explanation="Implicit label association - simpler markup",
+    code="""<label>
+  {label}
+  <input type="{input_type}" placeholder="{placeholder}" />
+</label>""",
+    requires=(),
+    pros=(
+        "Simple markup",
+        "No id required",
+        "Clicking label focuses input",
+    ),
+    cons=("Less flexible for complex layouts",),
+    wcag_criterion=WCAG_3_3_2,
+)
+
+FORM_ARIA_LABEL_FIX = FixSuggestion(
+    rank=3,
+    method="aria_label",
+    wcag_level=LEVEL_A,
+    description="Add aria-label attribute",
+    explanation="Works but visible labels are preferred for all users",
+    code='<input type="{input_type}" aria-label="{label}" placeholder="{placeholder}" />',
+    requires=(),
+    pros=("Simple implementation", "No extra elements"),
+    cons=(
+        "Not visible to sighted users",
+        "Placeholders are not labels",
+        "Not ideal for usability",
+    ),
+    wcag_criterion=WCAG_3_3_2,
+    note="aria-label should be a last resort - visible labels benefit all users",
+)
+
+CONTRAST_DARKEN_FIX = FixSuggestion(
+    rank=1,
+    method="darken_foreground",
+    wcag_level=LEVEL_AA,
+    description="Darken text color for 4.5:1 contrast",
+    explanation="Current ratio {ratio:.1f}:1 fails WCAG AA (requires 4.5:1)",
+    code="color: {suggested}  /* Was {color} */",
+    requires=(),
+    pros=("Passes WCAG AA for normal text", "Minimal visual change"),
+    cons=(),
+    wcag_criterion=WCAG_1_4_3,
+    note="Use a contrast checker tool to verify: https://webaim.org/resources/contrastchecker/",
+)
+
+CONTRAST_LIGHTEN_FIX = FixSuggestion(
+    rank=2,
+    method="lighten_background",
+    wcag_level=LEVEL_AA,
+    description="Lighten background color",
+    explanation="Alternative: adjust background instead of foreground",
+    code="background: {suggested}  /* Was {color} */",
+    requires=(),
+    pros=("Maintains text color", "May fit design system better"),
+    cons=("Affects other elements on same background",),
+    wcag_criterion=WCAG_1_4_3,
+)
+
+FOCUS_VISIBLE_FIX = FixSuggestion(
+    rank=1,
+    method="focus_visible",
+    wcag_level=LEVEL_AA,
+    description="Use :focus-visible for keyboard-only focus",
+    explanation="Shows focus only for keyboard navigation, not mouse clicks",
+    code=FOCUS_VISIBLE_CSS,
+    requires=("Modern browser support",),
+    pros=(
+        "Best UX - focus only shows for keyboard users",
+        "No focus ring on mouse click",
+        "WCAG AA compliant",
+    ),
+    cons=("Limited support in older browsers",),
+    wcag_criterion=WCAG_2_4_7,
+)
+
+CUSTOM_FOCUS_FIX = FixSuggestion(
+    rank=2,
+    method="custom_focus",
+    wcag_level=LEVEL_AA,
+    description="Add custom :focus styles",
+    explanation="Custom focus styles that match your design",
+    code=CUSTOM_FOCUS_CSS,
+    requires=(),
+    pros=(
+        "Works in all browsers",
+        "Matches design system",
+        "Clear focus indication",
+    ),
+    cons=("Shows on both keyboard and mouse focus",),
+    wcag_criterion=WCAG_2_4_7,
+)
+
+# Neither focus fix varies by issue
+FOCUS_FIXES = (FOCUS_VISIBLE_FIX, CUSTOM_FOCUS_FIX)
+
+KEYBOARD_SEMANTIC_BUTTON_FIX = FixSuggestion(
+    rank=1,
+    method="use_semantic_button",
+    wcag_level=LEVEL_AA,
+    description="Replace <{element}> with semantic <button>",
+    explanation="Native buttons have built-in keyboard support and accessibility",
+    code="<button onClick={{handleClick}}>\n  Click me\n</button>",
+    requires=(),
+    pros=(
+        "Built-in keyboard support (Enter, Space)",
+        "Proper role and focus management",
+        "Best practice",
+    ),
+    cons=("May require CSS changes for styling",),
+    wcag_criterion=WCAG_2_1_1,
+)
+
+KEYBOARD_HANDLERS_FIX = FixSuggestion(
+    rank=2,
+    method="add_keyboard_handlers",
+    wcag_level=LEVEL_A,
+    description="Add keyboard support to <{element}>",
+    explanation="Make div/span clickable via keyboard",
+    code=KEYBOARD_HANDLER_TEMPLATE,
+    requires=(),
+    pros=("Maintains current markup", "Adds keyboard support"),
+    cons=(
+        "More complex than using button",
+        "Must implement all button behaviors manually",
+    ),
+    wcag_criterion=WCAG_2_1_1,
+)
+
+ARIA_REMOVE_REDUNDANT_FIX = FixSuggestion(
+    rank=1,
+    method="remove_redundant",
+    wcag_level=LEVEL_A,
+    description='Remove redundant role="{role}"',
+    explanation='Native <{element}> already has role="{role}"',
+    code="{code}",
+    requires=(),
+    pros=(
+        "Cleaner code",
+        "No ARIA needed for native semantics",
+        'Follows best practice: "No ARIA is better than bad ARIA"',
+    ),
+    cons=(),
+    wcag_criterion=WCAG_4_1_2,
+    note="First rule of ARIA: Don't use ARIA if you can use native HTML",
+)
+
+HEADING_FIX_LEVEL_FIX = FixSuggestion(
+    rank=1,
+    method="fix_level",
+    wcag_level=LEVEL_A,
+    description="Change to <h{next_level}> to maintain hierarchy",
+    explanation="Heading jumps from h{prev_level} to h{current_level} - should increment by 1",
+    code="<h{next_level}>Heading text</h{next_level}>",
+    requires=(),
+    pros=(
+        "Proper document outline",
+        "Screen readers can navigate properly",
+        "SEO benefit",
+    ),
+    cons=("May affect visual size (solve with CSS)",),
+    wcag_criterion=WCAG_1_3_1,
+    note="Use CSS to style headings visually while maintaining semantic hierarchy",
+)
+
+LINK_DESCRIPTIVE_TEXT_FIX = FixSuggestion(
+    rank=1,
+    method="descriptive_text",
+    wcag_level=LEVEL_A,
+    description="Use descriptive link text",
+    explanation="Link text should describe where the link goes",
+    code='<a href="...">Read the full article</a>  /* Instead of "{link_text}" */',
+    requires=(),
+    pros=(
+        "Clear purpose for all users",
+        "Screen readers can list all links",
+        "Better SEO",
+    ),
+    cons=(),
+    wcag_criterion=WCAG_2_4_4,
+    note='Avoid "click here", "read more", "here" - be specific about destination',
+)
+
+GENERIC_MANUAL_REVIEW_FIX = FixSuggestion(
+    rank=1,
+    method="manual_review",
+    wcag_level=LEVEL_UNKNOWN,
+    description="Manual review required",
+    explanation="This issue requires manual analysis and fixing",
+    code="/* Review WCAG guidelines for this issue type */",
+    requires=(),
+    pros=(),
+    cons=(),
+    wcag_criterion=WCAG_UNKNOWN,
+)
+
+
+# Colors _shade_colors_batch parses in bulk; anything else takes the scalar path
+HEX_COLOR_RE = re.compile(r"#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})")
+# A role attribute with the whitespace before it, for removing redundant roles
+ROLE_ATTR_RE = re.compile(r'\s+role="([^"]+)"')
+
+# Below this many colors the scalar helpers are faster than a NumPy round-trip
+NUMPY_BATCH_MIN = 16
+
+# Generated fixes keyed by (method, element, frozen context). The same icon
+# button or contrast pair recurs across a Storybook, so repeats are a lookup.
+# Cleared wholesale once it reaches FIX_CACHE_SIZE entries.
+FIX_CACHE: Dict[Tuple, Tuple["FixSuggestion", ...]] = {}
+FIX_CACHE_SIZE = 4096
+
+# Shared read-only default for missing context mappings, instead of a fresh {}
+EMPTY_CONTEXT = MappingProxyType({})
+
+
+def fill_template(template: FixSuggestion, **values: Any) -> FixSuggestion:
+    """Copy a fix template, formatting its placeholder fields with values"""
+    return replace(
+        template,
+        **{
+            field: getattr(template, field).format_map(values)
+            for field in TEMPLATE_FIELDS
+        },
+    )
+
+
+def freeze_context(value: Any) -> Any:
+    """Hashable, type-tagged form of an issue context (raises TypeError if not)"""
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, freeze_context(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_context(v) for v in value)
+    # Tagged so 2 and 2.0 (or 1 and True), which render differently, don't collide
+    hash(value)
+    return (type(value).__name__, value)
+
+
+def parse_hex_color(color: str) -> Optional[int]:
+    """Parse a #rgb or #rrggbb color into a packed 0xRRGGBB int"""
+    color = color.lstrip("#")
+    if len(color) == 3:
+        color = "".join([c * 2 for c in color])
+
+    # Digits past the sixth (e.g. an alpha channel) are ignored
+    color = color[:6]
+    if len(color) != 6 or not color.isalnum():
+        return None
+    try:
+        return int(color, 16)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def darken_color(color: str) -> str:
+    """Darken a hex color (simplified)"""
+    value = parse_hex_color(color) if color.startswith("#") else None
+    if value is None:
+        # Not a parsable hex color, return safe default
+        return "#666"
+
+    # Scaling a channel by 0.7 can't leave 0-255, so no clamping is needed
+    r, g, b = value >> 16, (value >> 8) & 0xFF, value & 0xFF
+    return f"#{(int(r * 0.7) << 16) | (int(g * 0.7) << 8) | int(b * 0.7):06x}"
+
+
+@lru_cache(maxsize=256)
+def lighten_color(color: str) -> str:
+    """Lighten a hex color (simplified)"""
+    value = parse_hex_color(color) if color.startswith("#") else None
+    if value is None:
+        # Not a parsable hex color, return safe default
+        return "#f5f5f5"
+
+    # Moving a channel 30% toward 255 can't pass 255, so no clamping is needed
+    r, g, b = value >> 16, (value >> 8) & 0xFF, value & 0xFF
+    r = int(r + (255 - r) * 0.3)
+    g = int(g + (255 - g) * 0.3)
+    b = int(b + (255 - b) * 0.3)
+    return f"#{(r << 16) | (g << 8) | b:06x}"
 
 
 class FixGenerator:
     """Generates AI-powered accessibility fix suggestions"""
 
+    # Issue type -> generator method, resolved with getattr per issue
+    GENERATORS = {
+        "missing_accessible_name": "_generate_button_label_fixes",
+        "missing_alt_text": "_generate_img_alt_fixes",
+        "missing_form_label": "_generate_form_label_fixes",
+        "color_contrast": "_generate_contrast_fixes",
+        "missing_focus_indicator": "_generate_focus_fixes",
+        "missing_keyboard_support": "_generate_keyboard_fixes",
+        "redundant_aria_role": "_generate_aria_cleanup_fixes",
+        "heading_hierarchy_skip": "_generate_heading_fixes",
+        "ambiguous_link_text": "_generate_link_text_fixes",
+    }
+
+    # Issue types whose fixes quote the offending element, so it joins the
+    # FIX_CACHE key; every other generator depends on the context alone
+    ELEMENT_FIXES = frozenset(["redundant_aria_role"])
+
     def __init__(self, file_path: str):
         self.file_path = Path(file_path)
-        self.content = self.file_path.read_text()
+
+    @cached_property
+    def content(self) -> str:
+        """Component source, read on first use (the generators don't need it)"""
+        return self.file_path.read_text()
 
     def generate_fixes_for_issue(
         self, issue_type: str, element: str, context: Dict[str, Any], line_num: int
-    ) -> List[Dict[str, Any]]:
+    ) -> Iterator[FixSuggestion]:
         """
         Generate ranked fix suggestions for an accessibility issue
 
@@ -37,634 +619,376 @@ class FixGenerator:
             line_num: Line number where issue occurs
 
         Returns:
-            List of fix suggestions ranked by best practice
+            Iterator of fix suggestions ranked by best practice. Results are
+            cached per distinct issue; uncacheable contexts are built lazily.
         """
 
         # Route to specific generator based on issue type
-        generators = {
-            "missing_accessible_name": self._generate_button_label_fixes,
-            "missing_alt_text": self._generate_img_alt_fixes,
-            "missing_form_label": self._generate_form_label_fixes,
-            "color_contrast": self._generate_contrast_fixes,
-            "missing_focus_indicator": self._generate_focus_fixes,
-            "missing_keyboard_support": self._generate_keyboard_fixes,
-            "redundant_aria_role": self._generate_aria_cleanup_fixes,
-            "heading_hierarchy_skip": self._generate_heading_fixes,
-            "ambiguous_link_text": self._generate_link_text_fixes,
-        }
+        method_name = self.GENERATORS.get(issue_type, "_generate_generic_fixes")
+        generator = getattr(self, method_name)
+
+        try:
+            key = (
+                method_name,
+                element if issue_type in self.ELEMENT_FIXES else None,
+                freeze_context(context),
+            )
+        except TypeError:
+            # Unhashable context values; generate without caching
+            return generator(element, context, line_num)
+
+        fixes = FIX_CACHE.get(key)
+        if fixes is None:
+            fixes = tuple(generator(element, context, line_num))
+            if len(FIX_CACHE) >= FIX_CACHE_SIZE:
+                FIX_CACHE.clear()
+            FIX_CACHE[key] = fixes
+
+        # Suggestions are immutable, so cached ones are handed out directly
+        return iter(fixes)
+
+    def generate_fixes_batch(
+        self, issues: List[Dict[str, Any]]
+    ) -> List[List[FixSuggestion]]:
+        """
+        Generate fix suggestions for many issues in one call
+
+        Args:
+            issues: Issue dicts as emitted by analyze_component.py --json
+                (reads "type", "element", "context" and "line")
+
+        Returns:
+            One list of ranked fix suggestions per issue, in input order
+        """
 
-        generator = generators.get(issue_type, self._generate_generic_fixes)
-        return generator(element, context, line_num)
+        # Shade every contrast color up front so large audits take the NumPy
+        # batch path instead of one color at a time
+        contrast = [
+            i for i, issue in enumerate(issues) if issue["type"] == "color_contrast"
+        ]
+        contexts = [issues[i].get("context", EMPTY_CONTEXT) for i in contrast]
+        darker = self._darken_colors_batch(
+            [context.get("foreground_color", "#999") for context in contexts]
+        )
+        lighter = self._lighten_colors_batch(
+            [context.get("background_color", "#fff") for context in contexts]
+        )
+        shades = dict(zip(contrast, zip(darker, lighter)))
+
+        results = []
+        for i, issue in enumerate(issues):
+            context = issue.get("context", EMPTY_CONTEXT)
+            if i in shades:
+                fixes = self._contrast_fixes(context, *shades[i])
+            else:
+                fixes = self.generate_fixes_for_issue(
+                    issue["type"],
+                    issue.get("element", ""),
+                    context,
+                    issue.get("line", 0),
+                )
+            results.append(list(fixes))
+        return results
 
     def _generate_button_label_fixes(
         self, element: str, context: Dict[str, Any], line_num: int
-    ) -> List[Dict]:
+    ) -> Iterator[FixSuggestion]:
         """Generate fixes for buttons without accessible names"""
 
-        button_purpose = context.get("button_purpose", {}).get(
-            "purpose", "generic_button"
-        )
-        suggested_label = context.get("button_purpose", {}).get(
-            "suggested_label", "Action"
-        )
+        purpose_info = context.get("button_purpose") or EMPTY_CONTEXT
+        if isinstance(purpose_info, str):
+            # analyze_component.py reports only the purpose name
+            purpose_info = {"purpose": purpose_info}
+
+        button_purpose = purpose_info.get("purpose", "generic_button")
+        suggested_label = purpose_info.get("suggested_label", "Action")
         is_icon_only = context.get("is_icon_only", False)
         content = context.get("content", "")
 
-        fixes = []
+        # Context-specific recommendation, attached to the first fix
+        note = BUTTON_PURPOSE_NOTES.get(button_purpose)
+        has_sr_only = is_icon_only or content in ["×", "✕", "X", ""]
 
         # Fix 1: sr-only text (best for icon buttons)
-        if is_icon_only or content in ["×", "✕", "X", ""]:
-            fixes.append(
-                {
-                    "rank": 1,
-                    "method": "sr_only_with_icon",
-                    "wcag_level": "AA",
-                    "description": "Add visually hidden text alongside icon",
-                    "explanation": "Best practice for icon buttons - maintains visual design while providing screen reader text",
-                    "code": self._generate_button_sr_only_code(
-                        content or "×", suggested_label
-                    ),
-                    "requires": ["sr-only CSS class"],
-                    "pros": [
-                        "Maintains visual design",
-                        "Clear to screen reader users",
-                        "Follows WCAG best practices",
-                    ],
-                    "cons": ["Requires sr-only CSS utility class"],
-                    "wcag_criterion": "4.1.2 Name, Role, Value",
-                }
+        if has_sr_only:
+            fix = fill_template(
+                BUTTON_SR_ONLY_FIX,
+                code=self._generate_button_sr_only_code(
+                    content or "×", suggested_label
+                ),
             )
+            if note:
+                fix = replace(fix, note=note)
+            yield fix
 
         # Fix 2: aria-label (good for most cases)
-        fixes.append(
-            {
-                "rank": 2 if is_icon_only else 1,
-                "method": "aria_label",
-                "wcag_level": "AA",
-                "description": "Add aria-label attribute",
-                "explanation": "Simple and effective - works immediately without CSS changes",
-                "code": f'<button aria-label="{suggested_label}" onClick={{...}}>\n  {content or "..."}\n</button>',
-                "requires": [],
-                "pros": [
-                    "Simple implementation",
-                    "No CSS required",
-                    "Works in all browsers",
-                ],
-                "cons": [
-                    "Not translatable without additional i18n setup",
-                    "Overrides visible text if present",
-                ],
-                "wcag_criterion": "4.1.2 Name, Role, Value",
-            }
+        fix = fill_template(
+            BUTTON_ARIA_LABEL_FIX, label=suggested_label, content=content or "..."
         )
+        if is_icon_only:
+            fix = replace(fix, rank=2)
+        if note and not has_sr_only:
+            fix = replace(fix, note=note)
+        yield fix
 
         # Fix 3: Visible text (best when space allows)
         if is_icon_only:
-            fixes.append(
-                {
-                    "rank": 3,
-                    "method": "visible_text",
-                    "wcag_level": "AAA",
-                    "description": "Replace icon with visible text",
-                    "explanation": "Best for all users - everyone benefits from clear text",
-                    "code": f"<button onClick={{...}}>\n  {suggested_label}\n</button>",
-                    "requires": [],
-                    "pros": [
-                        "Clearest for all users",
-                        "No screen reader needed",
-                        "Best accessibility score",
-                    ],
-                    "cons": ["Changes visual design", "Requires more space"],
-                    "wcag_criterion": "4.1.2 Name, Role, Value",
-                }
-            )
+            yield fill_template(BUTTON_VISIBLE_TEXT_FIX, label=suggested_label)
 
         # Fix 4: title attribute (acceptable fallback)
-        fixes.append(
-            {
-                "rank": 4,
-                "method": "title_attribute",
-                "wcag_level": "A",
-                "description": "Add title attribute",
-                "explanation": "Acceptable but not ideal - not announced by all screen readers",
-                "code": f'<button title="{suggested_label}" onClick={{...}}>\n  {content or "..."}\n</button>',
-                "requires": [],
-                "pros": ["Simple implementation", "Provides tooltip for mouse users"],
-                "cons": [
-                    "Not announced by all screen readers",
-                    "Inconsistent browser support",
-                    "Tooltip may not appear on touch devices",
-                ],
-                "wcag_criterion": "4.1.2 Name, Role, Value",
-            }
+        yield fill_template(
+            BUTTON_TITLE_FIX, label=suggested_label, content=content or "..."
         )
 
-        # Add context-specific recommendations
-        if button_purpose == "close_button":
-            fixes[0]["note"] = (
-                'For close buttons, "Close" or "Close dialog" are standard labels'
-            )
-        elif button_purpose == "submit_button":
-            fixes[0]["note"] = (
-                'For submit buttons, be specific: "Submit form", "Save changes", etc.'
-            )
-        elif button_purpose == "delete_button":
-            fixes[0]["note"] = (
-                'For delete buttons, include what\'s being deleted: "Delete item"'
-            )
-
-        return fixes
-
     def _generate_button_sr_only_code(self, icon_content: str, label: str) -> str:
         """Generate sr-only button code"""
-        return f"""<button onClick={{...}}>
-  <span aria-hidden="true">{icon_content}</span>
-  <span className="sr-only">{label}</span>
-</button>
-
-/* Add to your global CSS: */
-.sr-only {{
-  position: absolute;
-  width: 1px;
-  height: 1px;
-  padding: 0;
-  margin: -1px;
-  overflow: hidden;
-  clip: rect(0, 0, 0, 0);
-  white-space: nowrap;
-  border-width: 0;
-}}"""
+        return (
+            "<button onClick={...}>\n"
+            f'  <span aria-hidden="true">{icon_content}</span>\n'
+            f'  <span className="sr-only">{label}</span>\n'
+            "</button>" + SR_ONLY_CSS
+        )
 
     def _generate_img_alt_fixes(
         self, element: str, context: Dict[str, Any], line_num: int
-    ) -> List[Dict]:
+    ) -> Iterator[FixSuggestion]:
         """Generate fixes for images without alt text"""
 
         is_decorative = context.get("is_decorative", False)
         src = context.get("src", "")
 
-        fixes = []
-
         if is_decorative:
             # Decorative image
-            fixes.append(
-                {
-                    "rank": 1,
-                    "method": "empty_alt",
-                    "wcag_level": "A",
-                    "description": "Add empty alt attribute for decorative image",
-                    "explanation": "Tells screen readers to skip this image (it's decorative)",
-                    "code": '<img src={...} alt="" aria-hidden="true" />',
-                    "requires": [],
-                    "pros": [
-                        "Screen readers skip the image",
-                        "Cleaner screen reader experience",
-                        "Follows WCAG decorative image pattern",
-                    ],
-                    "cons": [],
-                    "wcag_criterion": "1.1.1 Non-text Content",
-                    "note": 'Use empty alt="" for purely decorative images (backgrounds, spacers, visual decoration)',
-                }
-            )
-        else:
-            # Informative image
-            fixes.append(
-                {
-                    "rank": 1,
-                    "method": "descriptive_alt",
-                    "wcag_level": "A",
-                    "description": "Add descriptive alt text",
-                    "explanation": "Describe what the image shows or its purpose",
-                    "code": '<img src={...} alt="Description of image content" />',
-                    "requires": [],
-                    "pros": [
-                        "Screen reader users know image content",
-                        "Works when images fail to load",
-                        "Improves SEO",
-                    ],
-                    "cons": [],
-                    "wcag_criterion": "1.1.1 Non-text Content",
-                    "note": "Be specific and concise. Describe what's important about the image.",
-                }
-            )
+            yield IMG_EMPTY_ALT_FIX
+            return
 
-            # For complex images
-            if (
-                "chart" in src.lower()
-                or "graph" in src.lower()
-                or "diagram" in src.lower()
-            ):
-                fixes.append(
-                    {
-                        "rank": 2,
-                        "method": "long_description",
-                        "wcag_level": "AA",
-                        "description": "Add alt text + detailed description",
-                        "explanation": "For complex images like charts, provide both summary and details",
-                        "code": """<figure>
-  <img src={...} alt="Bar chart showing sales growth" aria-describedby="chart-description" />
-  <figcaption id="chart-description">
-    Detailed description: Sales grew 40% in Q4, from $100K to $140K...
-  </figcaption>
-</figure>""",
-                        "requires": [],
-                        "pros": [
-                            "Provides both summary and details",
-                            "Visible to all users",
-                            "Best for complex data visualizations",
-                        ],
-                        "cons": ["Requires more markup", "May not fit all designs"],
-                        "wcag_criterion": "1.1.1 Non-text Content",
-                    }
-                )
+        # Informative image
+        yield IMG_DESCRIPTIVE_ALT_FIX
 
-        return fixes
+        # For complex images
+        src = src.lower()
+        if "chart" in src or "graph" in src or "diagram" in src:
+            yield IMG_LONG_DESCRIPTION_FIX
 
     def _generate_form_label_fixes(
         self, element: str, context: Dict[str, Any], line_num: int
-    ) -> List[Dict]:
+    ) -> Iterator[FixSuggestion]:
         """Generate fixes for form inputs without labels"""
 
         input_type = context.get("input_type", "text")
         placeholder = context.get("placeholder", "")
 
-        label_text = placeholder or f"{input_type.capitalize()}"
-
-        fixes = []
+        values = {
+            "label": placeholder or f"{input_type.capitalize()}",
+            "input_type": input_type,
+            "placeholder": placeholder or "Enter text...",
+        }
 
         # Fix 1: Explicit label with htmlFor (best)
-        fixes.append(
-            {
-                "rank": 1,
-                "method": "explicit_label",
-                "wcag_level": "AA",
-                "description": "Add label with htmlFor attribute",
-                "explanation": "Most robust - works even if elements are separated in the DOM",
-                "code": f'''<label htmlFor="input-id">
-  {label_text}
-</label>
-<input id="input-id" type="{input_type}" placeholder="{placeholder or "Enter text..."}" />''',
-                "requires": ["Unique id on input"],
-                "pros": [
-                    "Most robust label association",
-                    "Works with separated elements",
-                    "Clicking label focuses input",
-                ],
-                "cons": ["Requires unique id"],
-                "wcag_criterion": "3.3.2 Labels or Instructions",
-            }
-        )
+        yield fill_template(FORM_EXPLICIT_LABEL_FIX, **values)
 
         # Fix 2: Wrapping label (good)
-        fixes.append(
-            {
-                "rank": 2,
-                "method": "wrapping_label",
-                "wcag_level": "AA",
-                "description": "Wrap input in label element",
-                "explanation": "Implicit label association - simpler markup",
-                "code": f'''<label>
-  {label_text}
-  <input type="{input_type}" placeholder="{placeholder or "Enter text..."}" />
-</label>''',
-                "requires": [],
-                "pros": [
-                    "Simple markup",
-                    "No id required",
-                    "Clicking label focuses input",
-                ],
-                "cons": ["Less flexible for complex layouts"],
-                "wcag_criterion": "3.3.2 Labels or Instructions",
-            }
-        )
+        yield fill_template(FORM_WRAPPING_LABEL_FIX, **values)
 
         # Fix 3: aria-label (acceptable)
-        fixes.append(
-            {
-                "rank": 3,
-                "method": "aria_label",
-                "wcag_level": "A",
-                "description": "Add aria-label attribute",
-                "explanation": "Works but visible labels are preferred for all users",
-                "code": f'<input type="{input_type}" aria-label="{label_text}" placeholder="{placeholder or "Enter text..."}" />',
-                "requires": [],
-                "pros": ["Simple implementation", "No extra elements"],
-                "cons": [
-                    "Not visible to sighted users",
-                    "Placeholders are not labels",
-                    "Not ideal for usability",
-                ],
-                "wcag_criterion": "3.3.2 Labels or Instructions",
-                "note": "aria-label should be a last resort - visible labels benefit all users",
-            }
-        )
-
-        return fixes
+        yield fill_template(FORM_ARIA_LABEL_FIX, **values)
 
     def _generate_contrast_fixes(
         self, element: str, context: Dict[str, Any], line_num: int
-    ) -> List[Dict]:
+    ) -> Iterator[FixSuggestion]:
         """Generate fixes for color contrast issues"""
 
+        # Calculate suggested colors (simplified)
+        return self._contrast_fixes(
+            context,
+            self._darken_color(context.get("foreground_color", "#999")),
+            self._lighten_color(context.get("background_color", "#fff")),
+        )
+
+    def _contrast_fixes(
+        self, context: Dict[str, Any], suggested_darker: str, suggested_lighter_bg: str
+    ) -> Iterator[FixSuggestion]:
+        """Build contrast fixes from already-shaded suggestion colors"""
+
         fg_color = context.get("foreground_color", "#999")
         bg_color = context.get("background_color", "#fff")
         current_ratio = context.get("contrast_ratio", 0)
 
-        fixes = []
-
-        # Calculate suggested colors (simplified)
-        suggested_darker = self._darken_color(fg_color)
-        suggested_lighter_bg = self._lighten_color(bg_color)
-
-        fixes.append(
-            {
-                "rank": 1,
-                "method": "darken_foreground",
-                "wcag_level": "AA",
-                "description": f"Darken text color for {4.5}:1 contrast",
-                "explanation": f"Current ratio {current_ratio:.1f}:1 fails WCAG AA (requires 4.5:1)",
-                "code": f"color: {suggested_darker}  /* Was {fg_color} */",
-                "requires": [],
-                "pros": ["Passes WCAG AA for normal text", "Minimal visual change"],
-                "cons": [],
-                "wcag_criterion": "1.4.3 Contrast (Minimum)",
-                "note": "Use a contrast checker tool to verify: https://webaim.org/resources/contrastchecker/",
-            }
+        yield fill_template(
+            CONTRAST_DARKEN_FIX,
+            ratio=current_ratio,
+            suggested=suggested_darker,
+            color=fg_color,
         )
-
-        fixes.append(
-            {
-                "rank": 2,
-                "method": "lighten_background",
-                "wcag_level": "AA",
-                "description": "Lighten background color",
-                "explanation": "Alternative: adjust background instead of foreground",
-                "code": f"background: {suggested_lighter_bg}  /* Was {bg_color} */",
-                "requires": [],
-                "pros": ["Maintains text color", "May fit design system better"],
-                "cons": ["Affects other elements on same background"],
-                "wcag_criterion": "1.4.3 Contrast (Minimum)",
-            }
+        yield fill_template(
+            CONTRAST_LIGHTEN_FIX, suggested=suggested_lighter_bg, color=bg_color
         )
 
-        return fixes
-
     def _generate_focus_fixes(
         self, element: str, context: Dict[str, Any], line_num: int
-    ) -> List[Dict]:
+    ) -> Iterator[FixSuggestion]:
         """Generate fixes for missing focus indicators"""
 
-        return [
-            {
-                "rank": 1,
-                "method": "focus_visible",
-                "wcag_level": "AA",
-                "description": "Use :focus-visible for keyboard-only focus",
-                "explanation": "Shows focus only for keyboard navigation, not mouse clicks",
-                "code": """button {
-  outline: none; /* Remove default outline */
-}
-
-button:focus-visible {
-  outline: 2px solid #2196F3;
-  outline-offset: 2px;
-}""",
-                "requires": ["Modern browser support"],
-                "pros": [
-                    "Best UX - focus only shows for keyboard users",
-                    "No focus ring on mouse click",
-                    "WCAG AA compliant",
-                ],
-                "cons": ["Limited support in older browsers"],
-                "wcag_criterion": "2.4.7 Focus Visible",
-            },
-            {
-                "rank": 2,
-                "method": "custom_focus",
-                "wcag_level": "AA",
-                "description": "Add custom :focus styles",
-                "explanation": "Custom focus styles that match your design",
-                "code": """button:focus {
-  outline: 2px solid #2196F3;
-  outline-offset: 2px;
-  box-shadow: 0 0 0 3px rgba(33, 150, 243, 0.2);
-}""",
-                "requires": [],
-                "pros": [
-                    "Works in all browsers",
-                    "Matches design system",
-                    "Clear focus indication",
-                ],
-                "cons": ["Shows on both keyboard and mouse focus"],
-                "wcag_criterion": "2.4.7 Focus Visible",
-            },
-        ]
+        yield from FOCUS_FIXES
 
     def _generate_keyboard_fixes(
         self, element: str, context: Dict[str, Any], line_num: int
-    ) -> List[Dict]:
+    ) -> Iterator[FixSuggestion]:
         """Generate fixes for keyboard accessibility"""
 
         element_type = context.get("element", "div")
 
-        return [
-            {
-                "rank": 1,
-                "method": "use_semantic_button",
-                "wcag_level": "AA",
-                "description": f"Replace <{element_type}> with semantic <button>",
-                "explanation": "Native buttons have built-in keyboard support and accessibility",
-                "code": "<button onClick={handleClick}>\n  Click me\n</button>",
-                "requires": [],
-                "pros": [
-                    "Built-in keyboard support (Enter, Space)",
-                    "Proper role and focus management",
-                    "Best practice",
-                ],
-                "cons": ["May require CSS changes for styling"],
-                "wcag_criterion": "2.1.1 Keyboard",
-            },
-            {
-                "rank": 2,
-                "method": "add_keyboard_handlers",
-                "wcag_level": "A",
-                "description": f"Add keyboard support to <{element_type}>",
-                "explanation": "Make div/span clickable via keyboard",
-                "code": f"""<{element_type}
-  role="button"
-  tabIndex={{0}}
-  onClick={{handleClick}}
-  onKeyDown={{(e) => {{
-    if (e.key === 'Enter' || e.key === ' ') {{
-      e.preventDefault();
-      handleClick();
-    }}
-  }}}}
->
-  Click me
-</{element_type}>""",
-                "requires": [],
-                "pros": ["Maintains current markup", "Adds keyboard support"],
-                "cons": [
-                    "More complex than using button",
-                    "Must implement all button behaviors manually",
-                ],
-                "wcag_criterion": "2.1.1 Keyboard",
-            },
-        ]
+        yield fill_template(KEYBOARD_SEMANTIC_BUTTON_FIX, element=element_type)
+        yield fill_template(KEYBOARD_HANDLERS_FIX, element=element_type)
 
     def _generate_aria_cleanup_fixes(
         self, element: str, context: Dict[str, Any], line_num: int
-    ) -> List[Dict]:
+    ) -> Iterator[FixSuggestion]:
         """Generate fixes for redundant ARIA"""
 
         redundant_role = context.get("redundant_role", "button")
         elem_type = context.get("element", "button")
 
-        return [
-            {
-                "rank": 1,
-                "method": "remove_redundant",
-                "wcag_level": "A",
-                "description": f'Remove redundant role="{redundant_role}"',
-                "explanation": f'Native <{elem_type}> already has role="{redundant_role}"',
-                "code": element.replace(f'role="{redundant_role}"', "").replace(
-                    "  ", " "
-                ),
-                "requires": [],
-                "pros": [
-                    "Cleaner code",
-                    "No ARIA needed for native semantics",
-                    'Follows best practice: "No ARIA is better than bad ARIA"',
-                ],
-                "cons": [],
-                "wcag_criterion": "4.1.2 Name, Role, Value",
-                "note": "First rule of ARIA: Don't use ARIA if you can use native HTML",
-            }
-        ]
+        yield fill_template(
+            ARIA_REMOVE_REDUNDANT_FIX,
+            role=redundant_role,
+            element=elem_type,
+            code=ROLE_ATTR_RE.sub(
+                lambda m: "" if m.group(1) == redundant_role else m.group(0), element
+            ),
+        )
 
     def _generate_heading_fixes(
         self, element: str, context: Dict[str, Any], line_num: int
-    ) -> List[Dict]:
+    ) -> Iterator[FixSuggestion]:
         """Generate fixes for heading hierarchy"""
 
         prev_level = context.get("prev_level", 1)
         current_level = context.get("current_level", 3)
 
-        return [
-            {
-                "rank": 1,
-                "method": "fix_level",
-                "wcag_level": "A",
-                "description": f"Change to <h{prev_level + 1}> to maintain hierarchy",
-                "explanation": f"Heading jumps from h{prev_level} to h{current_level} - should increment by 1",
-                "code": f"<h{prev_level + 1}>Heading text</h{prev_level + 1}>",
-                "requires": [],
-                "pros": [
-                    "Proper document outline",
-                    "Screen readers can navigate properly",
-                    "SEO benefit",
-                ],
-                "cons": ["May affect visual size (solve with CSS)"],
-                "wcag_criterion": "1.3.1 Info and Relationships",
-                "note": "Use CSS to style headings visually while maintaining semantic hierarchy",
-            }
-        ]
+        yield fill_template(
+            HEADING_FIX_LEVEL_FIX,
+            prev_level=prev_level,
+            current_level=current_level,
+            next_level=prev_level + 1,
+        )
 
     def _generate_link_text_fixes(
         self, element: str, context: Dict[str, Any], line_num: int
-    ) -> List[Dict]:
+    ) -> Iterator[FixSuggestion]:
         """Generate fixes for ambiguous link text"""
 
         link_text = context.get("link_text", "click here")
 
-        return [
-            {
-                "rank": 1,
-                "method": "descriptive_text",
-                "wcag_level": "A",
-                "description": "Use descriptive link text",
-                "explanation": "Link text should describe where the link goes",
-                "code": f'<a href="...">Read the full article</a>  /* Instead of "{link_text}" */',
-                "requires": [],
-                "pros": [
-                    "Clear purpose for all users",
-                    "Screen readers can list all links",
-                    "Better SEO",
-                ],
-                "cons": [],
-                "wcag_criterion": "2.4.4 Link Purpose (In Context)",
-                "note": 'Avoid "click here", "read more", "here" - be specific about destination',
-            }
-        ]
+        yield fill_template(LINK_DESCRIPTIVE_TEXT_FIX, link_text=link_text)
 
     def _generate_generic_fixes(
         self, element: str, context: Dict[str, Any], line_num: int
-    ) -> List[Dict]:
+    ) -> Iterator[FixSuggestion]:
         """Fallback for unknown issue types"""
 
-        return [
-            {
-                "rank": 1,
-                "method": "manual_review",
-                "wcag_level": "Unknown",
-                "description": "Manual review required",
-                "explanation": "This issue requires manual analysis and fixing",
-                "code": "/* Review WCAG guidelines for this issue type */",
-                "requires": [],
-                "pros": [],
-                "cons": [],
-                "wcag_criterion": "See WCAG 2.2 documentation",
-            }
-        ]
+        yield GENERIC_MANUAL_REVIEW_FIX
 
     # Color manipulation helpers
 
     def _darken_color(self, color: str) -> str:
         """Darken a hex color (simplified)"""
-        if not color.startswith("#"):
-            return "#666"
-
-        # Remove # and convert to RGB
-        color = color.lstrip("#")
-        if len(color) == 3:
-            color = "".join([c * 2 for c in color])
-
-        # Darken by reducing RGB values
-        try:
-            r, g, b = [int(color[i : i + 2], 16) for i in (0, 2, 4)]
-            r = max(0, int(r * 0.7))
-            g = max(0, int(g * 0.7))
-            b = max(0, int(b * 0.7))
-            return f"#{r:02x}{g:02x}{b:02x}"
-        except (ValueError, IndexError):
-            # Color parsing failed, return safe default
-            return "#666"
+        # Palettes are small and repeat, so results are memoized per color
+        return darken_color(color)
 
     def _lighten_color(self, color: str) -> str:
         """Lighten a hex color (simplified)"""
-        if not color.startswith("#"):
-            return "#f5f5f5"
+        return lighten_color(color)
+
+    def _darken_colors_batch(self, colors: List[str]) -> List[str]:
+        """Darken many hex colors at once, matching _darken_color"""
+        return self._shade_colors_batch(colors, self._darken_color, darken=True)
+
+    def _lighten_colors_batch(self, colors: List[str]) -> List[str]:
+        """Lighten many hex colors at once, matching _lighten_color"""
+        return self._shade_colors_batch(colors, self._lighten_color, darken=False)
 
-        color = color.lstrip("#")
-        if len(color) == 3:
-            color = "".join([c * 2 for c in color])
+    def _shade_colors_batch(
+        self, colors: List[str], scalar: Callable[[str], str], darken: bool
+    ) -> List[str]:
+        """Apply a shade to #rgb/#rrggbb colors in one NumPy pass"""
+        if len(colors) < NUMPY_BATCH_MIN:
+            return [scalar(color) for color in colors]
 
+        # Imported here so single-fix runs don't pay NumPy's import time
         try:
-            r, g, b = [int(color[i : i + 2], 16) for i in (0, 2, 4)]
-            r = min(255, int(r + (255 - r) * 0.3))
-            g = min(255, int(g + (255 - g) * 0.3))
-            b = min(255, int(b + (255 - b) * 0.3))
-            return f"#{r:02x}{g:02x}{b:02x}"
-        except (ValueError, IndexError):
-            # Color parsing failed, return safe default
-            return "#f5f5f5"
+            import numpy as np
+        except ImportError:
+            return [scalar(color) for color in colors]
+
+        results = list(colors)
+        rows = []
+        digits = []
+        for i, color in enumerate(colors):
+            match = HEX_COLOR_RE.fullmatch(color)
+            if match is None:
+                # Defaults and unusual lengths follow the scalar rules
+                results[i] = scalar(color)
+                continue
+            hex_digits = match.group(1)
+            if len(hex_digits) == 3:
+                hex_digits = "".join([c * 2 for c in hex_digits])
+            rows.append(i)
+            digits.append(hex_digits)
+
+        if not rows:
+            return results
+
+        # Same float64 arithmetic and truncation as the scalar helpers
+        rgb = np.frombuffer(bytearray.fromhex("".join(digits)), dtype=np.uint8)
+        channels = rgb.astype(np.float64)
+        if darken:
+            shaded = (channels * 0.7).astype(np.uint8)
+        else:
+            shaded = (channels + (255 - channels) * 0.3).astype(np.uint8)
+        packed = shaded.tobytes().hex()
+
+        for n, i in enumerate(rows):
+            results[i] = "#" + packed[n * 6 : n * 6 + 6]
+        return results
+
+
+@lru_cache(maxsize=32)
+def get_generator(file_path: str) -> FixGenerator:
+    """Shared FixGenerator for a file, so per-issue callers reuse one instance"""
+    return FixGenerator(file_path)
+
+
+def generate_report_fixes(report_path: str) -> List[Dict[str, Any]]:
+    """Generate fixes for every issue in an analyze_component.py --json report"""
+    text = Path(report_path).read_text()
+    try:
+        reports = [json.loads(text)]
+    except json.JSONDecodeError:
+        # Directory reports are NDJSON, one file per line
+        reports = [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    results = []
+    for report in reports:
+        issues = report["issues"]
+        generator = get_generator(report["file"])
+        for issue, fixes in zip(issues, generator.generate_fixes_batch(issues)):
+            results.append(
+                {
+                    "file": report["file"],
+                    "line": issue["line"],
+                    "type": issue["type"],
+                    "fix_suggestions": [fix.to_dict() for fix in fixes],
+                }
+            )
+    return results
 
 
 def main():
     """CLI entry point"""
     if len(sys.argv) < 3:
         print("Usage: python generate_fixes.py <component_file> <issue_type>")
+        print("       python generate_fixes.py <report.json> --batch")
         print("\nSupported issue types:")
         print("  - missing_accessible_name")
         print("  - missing_alt_text")
@@ -678,7 +1002,13 @@ def main():
     issue_type = sys.argv[2]
 
     try:
-        generator = FixGenerator(file_path)
+        if issue_type == "--batch":
+            print(json.dumps(generate_report_fixes(file_path), indent=2))
+            return
+
+        generator = get_generator(file_path)
+        if not generator.file_path.is_file():
+            raise FileNotFoundError(file_path)
 
         # Mock context for demonstration
         context = {
@@ -687,11 +1017,13 @@ def main():
             "content": "×",
         }
 
-        fixes = generator.generate_fixes_for_issue(
-            issue_type, "<button>×</button>", context, 10
+        fixes = list(
+            generator.generate_fixes_for_issue(
+                issue_type, "<button>×</button>", context, 10
+            )
         )
 
-        print(json.dumps(fixes, indent=2))
+        print(json.dumps([fix.to_dict() for fix in fixes], indent=2))
 
     except FileNotFoundError:
         print(f"Error: File not found: {file_path}")
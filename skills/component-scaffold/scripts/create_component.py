@@ -7,20 +7,35 @@ and best practices built-in.
 """
 
 import argparse
-import json
 import re
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
+
 
 # Add parent directory to path for imports
 SCRIPT_DIR = Path(__file__).parent
 SKILL_DIR = SCRIPT_DIR.parent
 TEMPLATES_DIR = SKILL_DIR / "templates"
 
+# JSON output helper shared with the other skill scripts
+sys.path.insert(0, str(SKILL_DIR.resolve().parent / "shared"))
+from json_output import write_json  # noqa: E402
+
+# PascalCase word boundaries for to_kebab_case, compiled once
+KEBAB_WORD_RE = re.compile("(.)([A-Z][a-z]+)")
+KEBAB_BOUNDARY_RE = re.compile("([a-z0-9])([A-Z])")
+
+# Template placeholders such as {{COMPONENT_NAME}}, split out once per template
+PLACEHOLDER_RE = re.compile(r"\{\{([A-Z_]+)\}\}")
+
+# Output directories already created during this run
+CREATED_DIRS = set()
 
-@dataclass
+
+@dataclass(slots=True)
 class PropDefinition:
     """Component prop definition"""
 
@@ -31,7 +46,7 @@ class PropDefinition:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponentSpec:
     """Component specification"""
 
@@ -39,7 +54,7 @@ class ComponentSpec:
     component_type: str
     framework: str
     typescript: bool
-    props: List[PropDefinition]
+    props: Sequence[PropDefinition]
     has_children: bool
     description: str
 
@@ -48,7 +63,7 @@ class ComponentSpec:
 COMPONENT_TYPE_DEFAULTS = {
     "button": {
         "description": "Interactive button component with multiple variants and sizes",
-        "props": [
+        "props": (
             PropDefinition(
                 "variant",
                 "'primary' | 'secondary' | 'outline' | 'ghost'",
@@ -62,12 +77,12 @@ COMPONENT_TYPE_DEFAULTS = {
             PropDefinition("disabled", "boolean", False, "false", "Disabled state"),
             PropDefinition("loading", "boolean", False, "false", "Loading state"),
             PropDefinition("onClick", "() => void", False, None, "Click handler"),
-        ],
+        ),
         "has_children": True,
     },
     "input": {
         "description": "Form input component with validation and error states",
-        "props": [
+        "props": (
             PropDefinition("label", "string", True, None, "Input label"),
             PropDefinition(
                 "type",
@@ -85,12 +100,12 @@ COMPONENT_TYPE_DEFAULTS = {
             PropDefinition(
                 "onChange", "(value: string) => void", False, None, "Change handler"
             ),
-        ],
+        ),
         "has_children": False,
     },
     "card": {
         "description": "Card component for content containers",
-        "props": [
+        "props": (
             PropDefinition(
                 "variant",
                 "'elevated' | 'outlined' | 'flat'",
@@ -107,12 +122,12 @@ COMPONENT_TYPE_DEFAULTS = {
                 "footer", "React.ReactNode", False, None, "Card footer content"
             ),
             PropDefinition("onClick", "() => void", False, None, "Click handler"),
-        ],
+        ),
         "has_children": True,
     },
     "modal": {
         "description": "Modal dialog component with focus management",
-        "props": [
+        "props": (
             PropDefinition("isOpen", "boolean", True, None, "Open state"),
             PropDefinition("onClose", "() => void", True, None, "Close handler"),
             PropDefinition("title", "string", False, None, "Modal title"),
@@ -131,12 +146,12 @@ COMPONENT_TYPE_DEFAULTS = {
                 "Close on backdrop click",
             ),
             PropDefinition("closeOnEsc", "boolean", False, "true", "Close on ESC key"),
-        ],
+        ),
         "has_children": True,
     },
     "table": {
         "description": "Data table component with sorting and pagination",
-        "props": [
+        "props": (
             PropDefinition("data", "T[]", True, None, "Table data"),
             PropDefinition(
                 "columns", "TableColumn<T>[]", True, None, "Column definitions"
@@ -156,17 +171,75 @@ COMPONENT_TYPE_DEFAULTS = {
             PropDefinition(
                 "onRowClick", "(row: T) => void", False, None, "Row click handler"
             ),
-        ],
+        ),
         "has_children": False,
     },
     "custom": {
         "description": "Custom component",
-        "props": [],
+        "props": (),
         "has_children": True,
     },
 }
 
 
+# React markup for component types with fixed content
+REACT_CONTENT_TEMPLATES = {
+    "button": """<button
+      className={`btn btn-${variant} btn-${size}`}
+      disabled={disabled || loading}
+      onClick={onClick}
+      aria-busy={loading}
+    >
+      {loading ? 'Loading...' : children}
+    </button>""",
+    "input": """<div className="input-wrapper">
+      <label htmlFor={id} className="input-label">
+        {label}
+        {required && <span className="required">*</span>}
+      </label>
+      <input
+        id={id}
+        type={type}
+        className={`input ${error ? 'input-error' : ''}`}
+        placeholder={placeholder}
+        value={value}
+        disabled={disabled}
+        required={required}
+        onChange={(e) => onChange?.(e.target.value)}
+        aria-invalid={!!error}
+        aria-describedby={error ? `${id}-error` : helperText ? `${id}-helper` : undefined}
+      />
+      {error && <div id={`${id}-error`} className="input-error-message">{error}</div>}
+      {helperText && !error && <div id={`${id}-helper`} className="input-helper">{helperText}</div>}
+    </div>""",
+    "card": """<div className={`card card-${variant}`} onClick={onClick}>
+      {image && <img src={image} alt={imageAlt || ''} className="card-image" />}
+      {header && <div className="card-header">{header}</div>}
+      <div className="card-body">{children}</div>
+      {footer && <div className="card-footer">{footer}</div>}
+    </div>""",
+    "modal": """<>
+      {isOpen && (
+        <div className="modal-overlay" onClick={closeOnBackdropClick ? onClose : undefined}>
+          <div
+            className={`modal modal-${size}`}
+            onClick={(e) => e.stopPropagation()}
+            role="dialog"
+            aria-modal="true"
+            aria-labelledby={title ? 'modal-title' : undefined}
+          >
+            {title && <h2 id="modal-title" className="modal-title">{title}</h2>}
+            <button className="modal-close" onClick={onClose} aria-label="Close">
+              ×
+            </button>
+            <div className="modal-content">{children}</div>
+          </div>
+        </div>
+      )}
+    </>""",
+}
+
+
 class ComponentGenerator:
     """Generates component files from templates"""
 
@@ -233,8 +306,11 @@ class ComponentGenerator:
         # For custom type, parse custom props
         if component_type == "custom" and custom_props:
             props = ComponentGenerator.parse_custom_props(custom_props)
+        elif defaults["has_children"]:
+            props = list(defaults["props"])
         else:
-            props = defaults["props"].copy()
+            # Defaults are immutable tuples, safe to share without copying
+            props = defaults["props"]
 
         # Add children prop if needed
         if defaults["has_children"]:
@@ -262,14 +338,16 @@ class ComponentGenerator:
         )
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def to_kebab_case(name: str) -> str:
         """Convert PascalCase to kebab-case"""
-        s1 = re.sub("(.)([A-Z][a-z]+)", r"\1-\2", name)
-        return re.sub("([a-z0-9])([A-Z])", r"\1-\2", s1).lower()
+        s1 = KEBAB_WORD_RE.sub(r"\1-\2", name)
+        return KEBAB_BOUNDARY_RE.sub(r"\1-\2", s1).lower()
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def load_template(framework: str, component_type: str) -> str:
-        """Load component template"""
+        """Load component template (read once per framework and type)"""
         template_file = TEMPLATES_DIR / framework / f"{component_type}.template"
 
         # Fallback to custom template if specific type not found
@@ -282,6 +360,13 @@ class ComponentGenerator:
         with open(template_file, "r") as f:
             return f.read()
 
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def compile_template(framework: str, component_type: str) -> Tuple[str, ...]:
+        """Split a template into alternating literal text and placeholder names"""
+        template = ComponentGenerator.load_template(framework, component_type)
+        return tuple(PLACEHOLDER_RE.split(template))
+
     @staticmethod
     def generate_props_interface(spec: ComponentSpec) -> str:
         """Generate TypeScript props interface"""
@@ -319,75 +404,17 @@ class ComponentGenerator:
     def generate_component_content_react(spec: ComponentSpec) -> str:
         """Generate React component content based on type"""
 
-        if spec.component_type == "button":
-            return """<button
-      className={`btn btn-${variant} btn-${size}`}
-      disabled={disabled || loading}
-      onClick={onClick}
-      aria-busy={loading}
-    >
-      {loading ? 'Loading...' : children}
-    </button>"""
-
-        elif spec.component_type == "input":
-            return """<div className="input-wrapper">
-      <label htmlFor={id} className="input-label">
-        {label}
-        {required && <span className="required">*</span>}
-      </label>
-      <input
-        id={id}
-        type={type}
-        className={`input ${error ? 'input-error' : ''}`}
-        placeholder={placeholder}
-        value={value}
-        disabled={disabled}
-        required={required}
-        onChange={(e) => onChange?.(e.target.value)}
-        aria-invalid={!!error}
-        aria-describedby={error ? `${id}-error` : helperText ? `${id}-helper` : undefined}
-      />
-      {error && <div id={`${id}-error`} className="input-error-message">{error}</div>}
-      {helperText && !error && <div id={`${id}-helper`} className="input-helper">{helperText}</div>}
-    </div>"""
-
-        elif spec.component_type == "card":
-            return """<div className={`card card-${variant}`} onClick={onClick}>
-      {image && <img src={image} alt={imageAlt || ''} className="card-image" />}
-      {header && <div className="card-header">{header}</div>}
-      <div className="card-body">{children}</div>
-      {footer && <div className="card-footer">{footer}</div>}
-    </div>"""
-
-        elif spec.component_type == "modal":
-            return """<>
-      {isOpen && (
-        <div className="modal-overlay" onClick={closeOnBackdropClick ? onClose : undefined}>
-          <div
-            className={`modal modal-${size}`}
-            onClick={(e) => e.stopPropagation()}
-            role="dialog"
-            aria-modal="true"
-            aria-labelledby={title ? 'modal-title' : undefined}
-          >
-            {title && <h2 id="modal-title" className="modal-title">{title}</h2>}
-            <button className="modal-close" onClick={onClose} aria-label="Close">
-              ×
-            </button>
-            <div className="modal-content">{children}</div>
-          </div>
-        </div>
-      )}
-    </>"""
+        content = REACT_CONTENT_TEMPLATES.get(spec.component_type)
+        if content is not None:
+            return content
 
+        # Generic content
+        class_name = ComponentGenerator.to_kebab_case(spec.name)
+        if spec.has_children:
+            return f'<div className="{class_name}">\n      {{children}}\n    </div>'
         else:
-            # Generic content
-            class_name = ComponentGenerator.to_kebab_case(spec.name)
-            if spec.has_children:
-                return f'<div className="{class_name}">\n      {{children}}\n    </div>'
-            else:
-                comment = "{/* Component content */}"
-                return f'<div className="{class_name}">\n      {comment}\n    </div>'
+            comment = "{/* Component content */}"
+            return f'<div className="{class_name}">\n      {comment}\n    </div>'
 
     @staticmethod
     def generate_component_logic_react(spec: ComponentSpec) -> str:
@@ -419,7 +446,9 @@ class ComponentGenerator:
         """Generate complete component file"""
 
         # Load template
-        template = ComponentGenerator.load_template(spec.framework, spec.component_type)
+        parts = list(
+            ComponentGenerator.compile_template(spec.framework, spec.component_type)
+        )
 
         # Generate parts
         props_interface = ComponentGenerator.generate_props_interface(spec)
@@ -436,26 +465,28 @@ class ComponentGenerator:
 
         # Replace template variables
         replacements = {
-            "{{COMPONENT_NAME}}": spec.name,
-            "{{COMPONENT_CLASS}}": ComponentGenerator.to_kebab_case(spec.name),
-            "{{COMPONENT_DESCRIPTION}}": spec.description,
-            "{{PROPS}}": props_interface,
-            "{{PROP_DESTRUCTURING}}": prop_destructuring,
-            "{{COMPONENT_LOGIC}}": component_logic,
-            "{{COMPONENT_CONTENT}}": component_content,
+            "COMPONENT_NAME": spec.name,
+            "COMPONENT_CLASS": ComponentGenerator.to_kebab_case(spec.name),
+            "COMPONENT_DESCRIPTION": spec.description,
+            "PROPS": props_interface,
+            "PROP_DESTRUCTURING": prop_destructuring,
+            "COMPONENT_LOGIC": component_logic,
+            "COMPONENT_CONTENT": component_content,
         }
 
-        component_code = template
-        for placeholder, value in replacements.items():
-            component_code = component_code.replace(placeholder, value)
+        # Odd positions hold placeholder names; unknown ones are kept verbatim
+        for i in range(1, len(parts), 2):
+            parts[i] = replacements.get(parts[i], f"{{{{{parts[i]}}}}}")
+        component_code = "".join(parts)
 
         # Write to file if output path provided
         if output_path:
             output_file = Path(output_path)
-            output_file.parent.mkdir(parents=True, exist_ok=True)
+            if output_file.parent not in CREATED_DIRS:
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+                CREATED_DIRS.add(output_file.parent)
 
-            with open(output_file, "w") as f:
-                f.write(component_code)
+            output_file.write_bytes(component_code.encode("utf-8"))
 
             print(f"✅ Component generated: {output_path}")
 
@@ -497,9 +528,10 @@ def main():
 
     try:
         # Validate component name
-        if not args.name[0].isupper():
+        if not (args.name[:1].isupper() and args.name.isidentifier()):
             print(
-                "❌ Component name must start with uppercase letter (PascalCase)",
+                "❌ Component name must be an identifier starting with an uppercase"
+                " letter (PascalCase)",
                 file=sys.stderr,
             )
             sys.exit(1)
@@ -533,7 +565,7 @@ def main():
                 ],
                 "has_children": spec.has_children,
             }
-            print(json.dumps(spec_dict, indent=2))
+            write_json(spec_dict)
         else:
             # Generate component
             if args.dry_run:
@@ -0,0 +1,29 @@
+"""
+JSON output helper shared by the skill scripts
+"""
+
+import sys
+import json
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def write_json(obj: Any, indent: Optional[bool] = None):
+    """Write obj to stdout as JSON, indented by default only for a terminal"""
+    if indent is None:
+        indent = sys.stdout.isatty()
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        # Earlier print() output is still in the text layer's buffer
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(obj, option=option))
+    elif indent:
+        print(json.dumps(obj, indent=2))
+    else:
+        print(json.dumps(obj, separators=(",", ":")))
@@ -5,12 +5,22 @@ Analyzes prop types and generates intelligent story variants
 """
 
 import re
-import json
-from typing import List, Dict, Any
+import sys
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Dict, Any, Tuple
 from dataclasses import dataclass, asdict
+from pathlib import Path
 
+# JSON output helper shared with the other skill scripts
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "shared"))
+from json_output import write_json  # noqa: E402
 
-@dataclass
+# Quoted members of a union type: 'value' or "value"
+UNION_QUOTED_RE = re.compile(r'["\']([^"\']+)["\']')
+
+
+@dataclass(slots=True)
 class Variant:
     name: str
     description: str
@@ -23,52 +33,62 @@ class VariantDetector:
 
     # Common variant prop names and their values
     VARIANT_PATTERNS = {
-        "variant": [
-            "primary",
-            "secondary",
-            "outline",
-            "ghost",
-            "link",
-            "danger",
-            "success",
-            "warning",
-        ],
-        "color": ["primary", "secondary", "success", "warning", "danger", "info"],
-        "size": ["small", "medium", "large", "xs", "sm", "md", "lg", "xl"],
-        "type": ["button", "submit", "reset", "text", "email", "password", "number"],
-        "appearance": ["filled", "outline", "ghost", "link"],
-        "intent": ["primary", "success", "warning", "danger"],
+        "variant": frozenset(
+            [
+                "primary",
+                "secondary",
+                "outline",
+                "ghost",
+                "link",
+                "danger",
+                "success",
+                "warning",
+            ]
+        ),
+        "color": frozenset(
+            ["primary", "secondary", "success", "warning", "danger", "info"]
+        ),
+        "size": frozenset(["small", "medium", "large", "xs", "sm", "md", "lg", "xl"]),
+        "type": frozenset(
+            ["button", "submit", "reset", "text", "email", "password", "number"]
+        ),
+        "appearance": frozenset(["filled", "outline", "ghost", "link"]),
+        "intent": frozenset(["primary", "success", "warning", "danger"]),
     }
 
     # Size-related prop names
-    SIZE_PROPS = ["size", "fontSize", "width", "height"]
+    SIZE_PROPS = frozenset(["size", "fontSize", "width", "height"])
+
+    # Union values that map to the Small and Large size variants
+    SMALL_TOKENS = frozenset(["small", "sm", "xs"])
+    LARGE_TOKENS = frozenset(["large", "lg", "xl"])
 
     # Boolean state props
-    STATE_PROPS = [
-        "disabled",
-        "loading",
-        "active",
-        "selected",
-        "checked",
-        "error",
-        "readonly",
-    ]
+    STATE_PROPS = frozenset(
+        [
+            "disabled",
+            "loading",
+            "active",
+            "selected",
+            "checked",
+            "error",
+            "readonly",
+        ]
+    )
 
     @staticmethod
-    def detect_variants(component_metadata: Dict[str, Any]) -> List[Variant]:
-        """Detect all possible variants from component props"""
+    def detect_variants(component_metadata: Any) -> List[Variant]:
+        """Detect all possible variants from a metadata dict or ComponentMetadata"""
         variants = []
-        props = component_metadata.get("props", [])
-        component_type = component_metadata.get("component_type", "other")
-
-        # 1. Detect enum/union type variants
-        variants.extend(VariantDetector._detect_enum_variants(props))
-
-        # 2. Detect size variants
-        variants.extend(VariantDetector._detect_size_variants(props))
+        if isinstance(component_metadata, dict):
+            props = component_metadata.get("props", [])
+            component_type = component_metadata.get("component_type", "other")
+        else:
+            props = component_metadata.props
+            component_type = component_metadata.component_type
 
-        # 3. Detect state variants
-        variants.extend(VariantDetector._detect_state_variants(props))
+        # 1-3. Detect enum/union, size and state variants in one pass
+        variants.extend(VariantDetector._scan_props(props))
 
         # 4. Detect component-type specific variants
         variants.extend(
@@ -87,103 +107,83 @@ class VariantDetector:
             )
 
         # Sort by priority
-        variants.sort(key=lambda v: v.priority)
+        variants.sort(key=attrgetter("priority"))
 
         return variants
 
     @staticmethod
-    def _detect_enum_variants(props: List[Dict[str, Any]]) -> List[Variant]:
-        """Detect variants from enum/union types"""
-        variants = []
-
-        for prop in props:
-            prop_name = prop["name"]
-            prop_type = prop["type"]
-
-            # Check if prop name matches known variant patterns
-            if prop_name in VariantDetector.VARIANT_PATTERNS:
-                expected_values = VariantDetector.VARIANT_PATTERNS[prop_name]
-
-                # Parse union type: 'primary' | 'secondary' | 'outline'
-                union_values = VariantDetector._parse_union_type(prop_type)
-
-                if union_values:
-                    for value in union_values:
-                        # Only create variant if value is in expected list or if we don't have a list
-                        if not expected_values or value in expected_values:
-                            variants.append(
-                                Variant(
-                                    name=value.capitalize(),
-                                    description=f"{prop_name}: {value}",
-                                    args={prop_name: value},
-                                    priority=1,
-                                )
-                            )
-
-        return variants
+    def _prop_fields(prop: Any) -> Tuple[str, str]:
+        """Return (name, type) of a prop dict or parsed PropDefinition"""
+        if isinstance(prop, dict):
+            return prop["name"], prop["type"]
+        return prop.name, prop.type
 
     @staticmethod
-    def _detect_size_variants(props: List[Dict[str, Any]]) -> List[Variant]:
-        """Detect size-related variants"""
-        variants = []
+    def _scan_props(props: List[Any]) -> List[Variant]:
+        """Detect enum, size and state variants in a single pass over props"""
+        enum_variants = []
+        size_variants = []
+        state_variants = []
 
         for prop in props:
-            prop_name = prop["name"]
-            prop_type = prop["type"]
-
-            if prop_name.lower() in ["size", "fontsize"]:
-                union_values = VariantDetector._parse_union_type(prop_type)
-
-                if union_values:
-                    # Create small and large variants (skip medium/default)
-                    for value in union_values:
-                        if value.lower() in ["small", "sm", "xs"]:
-                            variants.append(
-                                Variant(
-                                    name="Small",
-                                    description="Small size variant",
-                                    args={prop_name: value},
-                                    priority=2,
-                                )
+            pname, ptype = VariantDetector._prop_fields(prop)
+            plower = pname.lower()
+
+            # Enum/union types: 'primary' | 'secondary' | 'outline'
+            if pname in VariantDetector.VARIANT_PATTERNS:
+                expected_values = VariantDetector.VARIANT_PATTERNS[pname]
+
+                for value in VariantDetector._parse_union_type(ptype):
+                    # Only create variant if value is in expected list or if we don't have a list
+                    if not expected_values or value in expected_values:
+                        enum_variants.append(
+                            Variant(
+                                name=value.capitalize(),
+                                description=f"{pname}: {value}",
+                                args={pname: value},
+                                priority=1,
                             )
-                        elif value.lower() in ["large", "lg", "xl"]:
-                            variants.append(
-                                Variant(
-                                    name="Large",
-                                    description="Large size variant",
-                                    args={prop_name: value},
-                                    priority=2,
-                                )
-                            )
-
-        return variants
-
-    @staticmethod
-    def _detect_state_variants(props: List[Dict[str, Any]]) -> List[Variant]:
-        """Detect boolean state variants"""
-        variants = []
+                        )
 
-        for prop in props:
-            prop_name = prop["name"]
-            prop_type = prop["type"]
-
-            # Check if it's a boolean type
-            if "boolean" in prop_type.lower():
-                if prop_name.lower() in VariantDetector.STATE_PROPS:
-                    variants.append(
-                        Variant(
-                            name=prop_name.capitalize(),
-                            description=f"{prop_name} state",
-                            args={prop_name: True},
-                            priority=2,
+            # Size props: create small and large variants (skip medium/default)
+            if plower == "size" or plower == "fontsize":
+                for value in VariantDetector._parse_union_type(ptype):
+                    vlower = value.lower()
+                    if vlower in VariantDetector.SMALL_TOKENS:
+                        size_variants.append(
+                            Variant(
+                                name="Small",
+                                description="Small size variant",
+                                args={pname: value},
+                                priority=2,
+                            )
                         )
+                    elif vlower in VariantDetector.LARGE_TOKENS:
+                        size_variants.append(
+                            Variant(
+                                name="Large",
+                                description="Large size variant",
+                                args={pname: value},
+                                priority=2,
+                            )
+                        )
+
+            # Boolean state props
+            if "boolean" in ptype.lower() and plower in VariantDetector.STATE_PROPS:
+                state_variants.append(
+                    Variant(
+                        name=pname.capitalize(),
+                        description=f"{pname} state",
+                        args={pname: True},
+                        priority=2,
                     )
+                )
 
-        return variants
+        return enum_variants + size_variants + state_variants
 
     @staticmethod
     def _detect_type_specific_variants(
-        component_type: str, props: List[Dict[str, Any]]
+        component_type: str, props: List[Any]
     ) -> List[Variant]:
         """Detect variants specific to component type"""
         variants = []
@@ -191,7 +191,9 @@ class VariantDetector:
         if component_type == "button":
             # Check for icon prop
             has_icon = any(
-                p["name"].lower() in ["icon", "lefticon", "righticon"] for p in props
+                VariantDetector._prop_fields(p)[0].lower()
+                in ["icon", "lefticon", "righticon"]
+                for p in props
             )
             if has_icon:
                 variants.append(
@@ -206,7 +208,9 @@ class VariantDetector:
         elif component_type == "input":
             # Error state
             has_error = any(
-                p["name"].lower() in ["error", "iserror", "haserror"] for p in props
+                VariantDetector._prop_fields(p)[0].lower()
+                in ["error", "iserror", "haserror"]
+                for p in props
             )
             if has_error:
                 variants.append(
@@ -246,49 +250,30 @@ class VariantDetector:
         return variants
 
     @staticmethod
-    def _parse_union_type(type_str: str) -> List[str]:
+    @lru_cache(maxsize=512)
+    def _parse_union_type(type_str: str) -> Tuple[str, ...]:
         """Parse union type string: 'primary' | 'secondary' | 'outline'"""
-        # Remove quotes and split by |
-        values = []
-
         # Pattern: 'value' or "value"
-        matches = re.findall(r'["\']([^"\']+)["\']', type_str)
-
+        matches = UNION_QUOTED_RE.findall(type_str)
         if matches:
-            values = matches
-        else:
-            # Try without quotes (TypeScript enums)
-            if "|" in type_str:
-                parts = type_str.split("|")
-                values = [p.strip() for p in parts if p.strip()]
+            return tuple(matches)
 
-        return values
+        # Try without quotes (TypeScript enums)
+        if "|" not in type_str:
+            return ()
+        return tuple(p for p in (s.strip() for s in type_str.split("|")) if p)
 
 
 def detect_variants_from_file(file_path: str) -> List[Variant]:
     """Parse component file and detect variants"""
+    # parse_component already reuses on-disk results for unchanged files
     from parse_component import parse_component
 
     metadata = parse_component(file_path)
     if not metadata:
         return []
 
-    # Convert to dict
-    metadata_dict = {
-        "name": metadata.name,
-        "component_type": metadata.component_type,
-        "props": [
-            {
-                "name": p.name,
-                "type": p.type,
-                "required": p.required,
-                "default_value": p.default_value,
-            }
-            for p in metadata.props
-        ],
-    }
-
-    return VariantDetector.detect_variants(metadata_dict)
+    return VariantDetector.detect_variants(metadata)
 
 
 def main():
@@ -305,7 +290,7 @@ def main():
 
     if args.json:
         data = [asdict(v) for v in variants]
-        print(json.dumps(data, indent=2))
+        write_json(data)
     else:
         print(f"Detected {len(variants)} variants:")
         for i, variant in enumerate(variants, 1):
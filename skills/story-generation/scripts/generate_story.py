@@ -4,14 +4,54 @@ Story generation orchestrator
 Combines component parser, variant detector, and templates to generate stories
 """
 
+import os
 import re
 import sys
+import glob
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
 # Import local modules
-from parse_component import parse_component, ComponentMetadata, PropDefinition
-from detect_variants import VariantDetector, Variant
+from parse_component import (
+    CacheRow,
+    ComponentMetadata,
+    PropDefinition,
+    parse_component,
+    remember_parsed,
+    take_parsed,
+)
+
+if TYPE_CHECKING:
+    from detect_variants import Variant
+
+# Below this many components, worker start-up costs more than it saves
+PARALLEL_MIN_FILES = 8
+
+# Template variables such as {{COMPONENT_NAME}}, split out once per template
+TEMPLATE_VAR_RE = re.compile(r"\{\{([A-Z_0-9]+)\}\}")
+
+# Prop name hints for control inference, one alternation per decision
+PERCENT_HINT_RE = re.compile("opacity|progress|percent|ratio")
+DIMENSION_HINT_RE = re.compile("size|width|height|padding|margin|gap")
+COLOR_HINT_RE = re.compile("color|background|bg|fill|stroke")
+IMAGE_HINT_RE = re.compile("image|avatar|photo")
+FILE_PROP_NAMES = frozenset(["file", "files", "src", "source"])
+
+# Quoted members of a union type: 'a' | 'b'
+UNION_LITERAL_RE = re.compile(r"'([^']+)'")
+
+
+# JavaScript literal formatting per variant arg value type; others use str()
+ARG_VALUE_FORMATS = {
+    str: "'{}'".format,
+    bool: {True: "true", False: "false"}.__getitem__,
+}
+
+
+def format_arg_value(value: Any) -> str:
+    """Format a variant arg value as a JavaScript literal"""
+    return ARG_VALUE_FORMATS.get(type(value), str)(value)
 
 
 class StoryGenerator:
@@ -19,6 +59,9 @@ class StoryGenerator:
 
     TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
 
+    # Loaded templates keyed by path, with the mtime they were read at
+    TEMPLATE_CACHE: Dict[Path, Tuple[int, Tuple[str, ...]]] = {}
+
     # Component type to interaction test mapping
     INTERACTION_TESTS = {
         "button": """
@@ -106,8 +149,7 @@ class StoryGenerator:
             return None
 
         # Detect variants
-        metadata_dict = StoryGenerator._metadata_to_dict(metadata)
-        variants = VariantDetector.detect_variants(metadata_dict)
+        variants = StoryGenerator._detect_variants(metadata)
 
         # Generate story content
         story_content = StoryGenerator._generate_story_content(
@@ -125,25 +167,16 @@ class StoryGenerator:
         return story_content
 
     @staticmethod
-    def _metadata_to_dict(metadata: ComponentMetadata) -> Dict[str, Any]:
-        """Convert ComponentMetadata to dict for variant detection"""
-        return {
-            "name": metadata.name,
-            "component_type": metadata.component_type,
-            "props": [
-                {
-                    "name": p.name,
-                    "type": p.type,
-                    "required": p.required,
-                    "default_value": p.default_value,
-                }
-                for p in metadata.props
-            ],
-        }
+    @lru_cache(maxsize=512)
+    def _detect_variants(metadata: ComponentMetadata) -> Tuple["Variant", ...]:
+        """Detect variants once per distinct component, across testing levels"""
+        from detect_variants import VariantDetector
+
+        return tuple(VariantDetector.detect_variants(metadata))
 
     @staticmethod
     def _generate_story_content(
-        metadata: ComponentMetadata, variants: List[Variant], testing_level: str
+        metadata: ComponentMetadata, variants: Sequence["Variant"], testing_level: str
     ) -> str:
         """Generate story file content from template"""
 
@@ -151,20 +184,19 @@ class StoryGenerator:
         template_name = f"{metadata.framework}-{testing_level}.template"
         template_path = StoryGenerator.TEMPLATE_DIR / template_name
 
+        template = StoryGenerator._load_template(template_path)
+
         # Fallback to basic template if specific level not found
-        if not template_path.exists():
+        if template is None:
             template_path = (
                 StoryGenerator.TEMPLATE_DIR / f"{metadata.framework}-basic.template"
             )
+            template = StoryGenerator._load_template(template_path)
 
-        if not template_path.exists():
+        if template is None:
             print(f"Template not found: {template_path}", file=sys.stderr)
             return ""
 
-        # Load template
-        with open(template_path, "r", encoding="utf-8") as f:
-            template = f.read()
-
         # Generate story title (Components/ComponentName)
         story_title = f"Components/{metadata.name}"
 
@@ -177,36 +209,53 @@ class StoryGenerator:
         # Generate default args
         default_args = StoryGenerator._generate_default_args(metadata)
 
-        # Generate interaction test code
-        interaction_test = StoryGenerator.INTERACTION_TESTS.get(
-            metadata.component_type, "// Component-specific interaction test"
+        # Interaction test, a11y rules and a11y test code for this type
+        interaction_test, a11y_rules, a11y_test = COMPONENT_TEST_BUNDLES.get(
+            metadata.component_type, DEFAULT_TEST_BUNDLE
         )
 
-        # Generate a11y rules
-        a11y_rules = ",\n          ".join(
-            StoryGenerator.A11Y_RULES.get(
-                metadata.component_type, ["{ id: 'color-contrast', enabled: true }"]
-            )
-        )
+        # Replace template variables
+        replacements = {
+            "COMPONENT_NAME": metadata.name,
+            "STORY_TITLE": story_title,
+            "ARG_TYPES": arg_types,
+            "VARIANT_STORIES": variant_stories,
+            "DEFAULT_ARGS": default_args,
+            "INTERACTION_TEST_CODE": interaction_test,
+            "A11Y_RULES": a11y_rules,
+            "A11Y_TEST_CODE": a11y_test,
+        }
 
-        # Generate a11y test code
-        a11y_test = StoryGenerator.A11Y_TEST_CODE.get(
-            metadata.component_type, "// Component-specific accessibility test"
-        )
+        # Odd positions hold variable names; unknown ones are kept verbatim
+        parts = list(template)
+        for i in range(1, len(parts), 2):
+            parts[i] = replacements.get(parts[i], f"{{{{{parts[i]}}}}}")
+        return "".join(parts)
 
-        # Replace template variables
-        story_content = template.replace("{{COMPONENT_NAME}}", metadata.name)
-        story_content = story_content.replace("{{STORY_TITLE}}", story_title)
-        story_content = story_content.replace("{{ARG_TYPES}}", arg_types)
-        story_content = story_content.replace("{{VARIANT_STORIES}}", variant_stories)
-        story_content = story_content.replace("{{DEFAULT_ARGS}}", default_args)
-        story_content = story_content.replace(
-            "{{INTERACTION_TEST_CODE}}", interaction_test.strip()
-        )
-        story_content = story_content.replace("{{A11Y_RULES}}", a11y_rules)
-        story_content = story_content.replace("{{A11Y_TEST_CODE}}", a11y_test.strip())
+    @staticmethod
+    def _load_template(template_path: Path) -> Optional[Tuple[str, ...]]:
+        """Load a template split into alternating literal text and variable names
 
-        return story_content
+        The split is cached and reused while the file's mtime is unchanged.
+        """
+        try:
+            mtime = template_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        cached = StoryGenerator.TEMPLATE_CACHE.get(template_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            template = tuple(
+                TEMPLATE_VAR_RE.split(template_path.read_text(encoding="utf-8"))
+            )
+        except FileNotFoundError:
+            return None
+
+        StoryGenerator.TEMPLATE_CACHE[template_path] = (mtime, template)
+        return template
 
     @staticmethod
     def _generate_arg_types(props: List[PropDefinition]) -> str:
@@ -258,24 +307,15 @@ class StoryGenerator:
         # Number - check for range hints
         if "number" in prop_type:
             # Use range slider for opacity, progress, percentage-like props
-            if any(
-                hint in prop_name
-                for hint in ["opacity", "progress", "percent", "ratio"]
-            ):
+            if PERCENT_HINT_RE.search(prop_name):
                 return "{ control: { type: 'range', min: 0, max: 1, step: 0.1 } }"
             # Use range for size/dimension props
-            if any(
-                hint in prop_name
-                for hint in ["size", "width", "height", "padding", "margin", "gap"]
-            ):
+            if DIMENSION_HINT_RE.search(prop_name):
                 return "{ control: { type: 'range', min: 0, max: 100, step: 1 } }"
             return "{ control: 'number' }"
 
         # Color - match by prop name pattern (background|color)
-        if any(
-            hint in prop_name
-            for hint in ["color", "background", "bg", "fill", "stroke"]
-        ):
+        if COLOR_HINT_RE.search(prop_name):
             return "{ control: 'color' }"
 
         # Date - match by prop name pattern (Date$)
@@ -293,14 +333,14 @@ class StoryGenerator:
             return "{ control: 'object' }"
 
         # File input
-        if "file" in prop_type or prop_name in ["file", "files", "src", "source"]:
-            if "image" in prop_name or "avatar" in prop_name or "photo" in prop_name:
+        if "file" in prop_type or prop_name in FILE_PROP_NAMES:
+            if IMAGE_HINT_RE.search(prop_name):
                 return "{ control: { type: 'file', accept: 'image/*' } }"
             return "{ control: 'file' }"
 
         # String with union (enum) - Storybook 10 syntax: options at top level
         if "|" in prop.type and "'" in prop.type:
-            matches = re.findall(r"'([^']+)'", prop.type)
+            matches = UNION_LITERAL_RE.findall(prop.type)
             if matches:
                 options_str = ", ".join([f"'{opt}'" for opt in matches])
                 # Use radio for 2-4 options, select for more
@@ -329,38 +369,36 @@ class StoryGenerator:
 
     @staticmethod
     def _generate_variant_stories(
-        metadata: ComponentMetadata, variants: List[Variant]
+        metadata: ComponentMetadata, variants: Sequence["Variant"]
     ) -> str:
         """Generate variant story exports"""
-        stories = []
+        parts = []
+        children_arg = f"    children: '{metadata.name}',"
 
         for variant in variants:
             # Generate args
-            args = []
-            for key, value in variant.args.items():
-                if isinstance(value, str):
-                    args.append(f"    {key}: '{value}',")
-                elif isinstance(value, bool):
-                    args.append(f"    {key}: {str(value).lower()},")
-                else:
-                    args.append(f"    {key}: {value},")
+            args = [
+                f"    {key}: {format_arg_value(value)},"
+                for key, value in variant.args.items()
+            ]
 
             # Add children for components that need it
             if metadata.has_children and "children" not in variant.args:
-                args.append(f"    children: '{metadata.name}',")
-
-            args_str = "\n".join(args)
-
-            story = f"""
-export const {variant.name}: Story = {{
-  args: {{
-{args_str}
-  }},
-}};
-"""
-            stories.append(story)
+                args.append(children_arg)
+
+            if parts:
+                parts.append("\n")
+            parts.extend(
+                (
+                    "\nexport const ",
+                    variant.name,
+                    ": Story = {\n  args: {\n",
+                    "\n".join(args),
+                    "\n  },\n};\n",
+                )
+            )
 
-        return "\n".join(stories)
+        return "".join(parts)
 
     @staticmethod
     def _generate_default_args(metadata: ComponentMetadata) -> str:
@@ -379,6 +417,90 @@ export const {variant.name}: Story = {{
         return "\n".join(args)
 
 
+def _test_bundle(component_type: str) -> Tuple[str, str, str]:
+    """Stripped interaction test, joined a11y rules and stripped a11y test"""
+    interaction_test = StoryGenerator.INTERACTION_TESTS.get(
+        component_type, "// Component-specific interaction test"
+    )
+    a11y_rules = StoryGenerator.A11Y_RULES.get(
+        component_type, ["{ id: 'color-contrast', enabled: true }"]
+    )
+    a11y_test = StoryGenerator.A11Y_TEST_CODE.get(
+        component_type, "// Component-specific accessibility test"
+    )
+    return (
+        interaction_test.strip(),
+        ",\n          ".join(a11y_rules),
+        a11y_test.strip(),
+    )
+
+
+# Test snippets per component type, built once at import
+COMPONENT_TEST_BUNDLES = {
+    component_type: _test_bundle(component_type)
+    for component_type in (
+        StoryGenerator.INTERACTION_TESTS.keys()
+        | StoryGenerator.A11Y_RULES.keys()
+        | StoryGenerator.A11Y_TEST_CODE.keys()
+    )
+}
+DEFAULT_TEST_BUNDLE = _test_bundle("")
+
+
+def default_story_path(component_path: str) -> Path:
+    """Story file written next to the component (ComponentName.stories.tsx)"""
+    path = Path(component_path)
+    return path.parent / f"{path.stem}.stories{path.suffix}"
+
+
+def generate_one(job: Tuple[str, str, bool]) -> Optional[str]:
+    """Generate the story for one component of a batch"""
+    component_path, testing_level, dry_run = job
+    output_path = None if dry_run else default_story_path(component_path)
+    return StoryGenerator.generate_story(component_path, testing_level, output_path)
+
+
+def _generate_in_worker(
+    job: Tuple[str, str, bool]
+) -> Tuple[Optional[str], List[CacheRow]]:
+    """Generate one story in a worker process, handing back its new cache rows"""
+    return generate_one(job), take_parsed()
+
+
+def generate_batch(
+    pattern: str, testing_level: str, dry_run: bool
+) -> List[Tuple[str, Optional[str]]]:
+    """Generate stories for every component matching a glob pattern
+
+    Components are independent, so larger batches are spread over a process
+    pool (the regex work holds the GIL, which rules out threads). Results
+    keep the sorted path order.
+    """
+    paths = sorted(
+        path
+        for path in glob.glob(pattern, recursive=True)
+        if ".stories." not in Path(path).name
+    )
+    jobs = [(path, testing_level, dry_run) for path in paths]
+
+    if len(jobs) < PARALLEL_MIN_FILES:
+        stories = map(generate_one, jobs)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_generate_in_worker, jobs, chunksize=8))
+
+        # Workers exit without saving their caches, so keep results here
+        stories = []
+        for story, rows in results:
+            stories.append(story)
+            remember_parsed(rows)
+
+    return list(zip(paths, stories))
+
+
 def main():
     """CLI interface"""
     import argparse
@@ -386,7 +508,13 @@ def main():
     parser = argparse.ArgumentParser(
         description="Generate Storybook stories from component"
     )
-    parser.add_argument("component_path", help="Path to component file")
+    parser.add_argument("component_path", nargs="?", help="Path to component file")
+    parser.add_argument(
+        "--batch",
+        metavar="PATTERN",
+        help="Generate stories for all components matching a glob pattern "
+        "(e.g. 'src/components/**/*.tsx')",
+    )
     parser.add_argument(
         "--level",
         "-l",
@@ -403,17 +531,30 @@ def main():
 
     args = parser.parse_args()
 
+    if args.batch:
+        if args.component_path or args.output:
+            parser.error("--batch cannot be combined with component_path or --output")
+
+        results = generate_batch(args.batch, args.level, args.dry_run)
+        if args.dry_run:
+            for _, story_content in results:
+                if story_content:
+                    print(story_content)
+
+        generated = sum(1 for _, story_content in results if story_content)
+        print(f"Generated {generated}/{len(results)} stories", file=sys.stderr)
+        return
+
+    if not args.component_path:
+        parser.error("component_path is required unless --batch is given")
+
     # Determine output path
     if args.output:
         output_path = args.output
     elif args.dry_run:
         output_path = None
     else:
-        component_path = Path(args.component_path)
-        output_path = (
-            component_path.parent
-            / f"{component_path.stem}.stories{component_path.suffix}"
-        )
+        output_path = default_story_path(args.component_path)
 
     # Generate story
     story_content = StoryGenerator.generate_story(
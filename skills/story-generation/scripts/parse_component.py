@@ -2,17 +2,124 @@
 """
 Component parser for React/TypeScript, Vue, and Svelte
 Extracts component metadata: name, props, types, variants
+
+Component names are classified with an Aho-Corasick automaton when
+pyahocorasick is installed (pip install pyahocorasick) and with a compiled
+keyword regex otherwise.
 """
 
+import os
 import re
 import json
+import sqlite3
 import sys
+import atexit
 from pathlib import Path
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Patterns are compiled once per process rather than on every parse
+FUNC_COMPONENT_RE = re.compile(r"function\s+([A-Z][A-Za-z0-9_]*)")
+CONST_COMPONENT_RE = re.compile(r"const\s+([A-Z][A-Za-z0-9_]*)\s*[=:]")
+TS_PROP_RE = re.compile(r"(\w+)(\?)?:\s*([^;]+);?")
+WHITESPACE_RE = re.compile(r"\s+")
+VUE_DEFINE_PROPS_RE = re.compile(r"defineProps<\{([^}]+)\}>", re.DOTALL)
+VUE_PROP_RE = re.compile(r"(\w+)(\?)?:\s*([^;,]+)")
+VUE_RUNTIME_PROPS_RE = re.compile(r"defineProps\(\{([^}]+)\}\)", re.DOTALL)
+VUE_RUNTIME_PROP_RE = re.compile(
+    r"(\w+):\s*\{[^}]*type:\s*(\w+)[^}]*required:\s*(true|false)?[^}]*\}"
+)
+SVELTE_EXPORT_RE = re.compile(
+    r"export\s+let\s+(\w+)(?::\s*([^=;]+))?(?:\s*=\s*([^;]+))?;?"
+)
+
+
+# Component categories in priority order, with the name terms that select them
+CLASSIFY_RULES = (
+    # Form inputs
+    ("button", ("button", "btn")),
+    ("input", ("input", "textfield", "textarea")),
+    ("select", ("select", "dropdown", "combo")),
+    ("checkbox", ("checkbox", "check")),
+    ("radio", ("radio",)),
+    ("switch", ("switch", "toggle")),
+
+    # Layout
+    ("card", ("card",)),
+    ("modal", ("modal", "dialog")),
+    ("sidebar", ("sidebar", "drawer")),
+    ("layout", ("container", "box", "grid")),
+
+    # Data display
+    ("table", ("table", "datagrid")),
+    ("list", ("list",)),
+    ("chart", ("chart", "graph")),
+    ("badge", ("badge", "tag", "chip")),
+    ("avatar", ("avatar",)),
+
+    # Feedback
+    ("alert", ("alert", "notification")),
+    ("toast", ("toast", "snackbar")),
+    ("progress", ("progress", "loader", "spinner")),
+
+    # Navigation
+    ("menu", ("menu", "nav")),
+    ("tabs", ("tab",)),
+    ("breadcrumb", ("breadcrumb",)),
+    ("pagination", ("pagination", "pager")),
+)
+
+# Priority of each term; a longer term also contains its prefix terms ("table"
+# contains "tab"), so it takes the best priority among them
+CLASSIFY_TERMS = [term for _, terms in CLASSIFY_RULES for term in terms]
+CLASSIFY_TERM_PRIORITY = {
+    term: min(
+        index
+        for index, (_, terms) in enumerate(CLASSIFY_RULES)
+        if any(term.startswith(prefix) for prefix in terms)
+    )
+    for term in CLASSIFY_TERMS
+}
+
+# Longest terms first so each position reports its longest matching term
+CLASSIFY_RE = re.compile("|".join(sorted(CLASSIFY_TERMS, key=len, reverse=True)))
+
+
+def _build_classify_automaton():
+    """Build an automaton over CLASSIFY_TERMS, if pyahocorasick is available"""
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for term, priority in CLASSIFY_TERM_PRIORITY.items():
+        automaton.add_word(term, priority)
+    automaton.make_automaton()
+    return automaton
+
+
+CLASSIFY_AUTOMATON = _build_classify_automaton()
+
+
+@lru_cache(maxsize=256)
+def props_declaration_re(component_name: str) -> re.Pattern:
+    """Props interface/type declarations, one group per alternative in preference
+    order: interface <Name>Props, interface Props, type <Name>Props, type Props"""
+    name = re.escape(component_name)
+    return re.compile(
+        rf"interface\s+{name}Props\s*\{{([^}}]+)\}}"
+        r"|interface\s+Props\s*\{([^}]+)\}"
+        rf"|type\s+{name}Props\s*=\s*\{{([^}}]+)\}}"
+        r"|type\s+Props\s*=\s*\{([^}]+)\}"
+    )
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PropDefinition:
     name: str
     type: str
@@ -21,12 +128,12 @@ class PropDefinition:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ComponentMetadata:
     name: str
     file_path: str
     framework: str  # 'react', 'vue', 'svelte'
-    props: List[PropDefinition]
+    props: Tuple[PropDefinition, ...]
     component_type: str  # 'button', 'input', 'card', 'table', etc.
     has_children: bool
     exports_default: bool
@@ -39,62 +146,24 @@ class ComponentParser:
     def classify_component(name: str, props: List[PropDefinition]) -> str:
         """Classify component type based on name and props"""
         name_lower = name.lower()
+        best = len(CLASSIFY_RULES)
 
-        # Form inputs
-        if any(term in name_lower for term in ["button", "btn"]):
-            return "button"
-        if any(term in name_lower for term in ["input", "textfield", "textarea"]):
-            return "input"
-        if any(term in name_lower for term in ["select", "dropdown", "combo"]):
-            return "select"
-        if any(term in name_lower for term in ["checkbox", "check"]):
-            return "checkbox"
-        if any(term in name_lower for term in ["radio"]):
-            return "radio"
-        if any(term in name_lower for term in ["switch", "toggle"]):
-            return "switch"
-
-        # Layout
-        if any(term in name_lower for term in ["card"]):
-            return "card"
-        if any(term in name_lower for term in ["modal", "dialog"]):
-            return "modal"
-        if any(term in name_lower for term in ["sidebar", "drawer"]):
-            return "sidebar"
-        if any(term in name_lower for term in ["container", "box", "grid"]):
-            return "layout"
-
-        # Data display
-        if any(term in name_lower for term in ["table", "datagrid"]):
-            return "table"
-        if any(term in name_lower for term in ["list"]):
-            return "list"
-        if any(term in name_lower for term in ["chart", "graph"]):
-            return "chart"
-        if any(term in name_lower for term in ["badge", "tag", "chip"]):
-            return "badge"
-        if any(term in name_lower for term in ["avatar"]):
-            return "avatar"
-
-        # Feedback
-        if any(term in name_lower for term in ["alert", "notification"]):
-            return "alert"
-        if any(term in name_lower for term in ["toast", "snackbar"]):
-            return "toast"
-        if any(term in name_lower for term in ["progress", "loader", "spinner"]):
-            return "progress"
-
-        # Navigation
-        if any(term in name_lower for term in ["menu", "nav"]):
-            return "menu"
-        if any(term in name_lower for term in ["tab"]):
-            return "tabs"
-        if any(term in name_lower for term in ["breadcrumb"]):
-            return "breadcrumb"
-        if any(term in name_lower for term in ["pagination", "pager"]):
-            return "pagination"
-
-        return "other"
+        # Every term occurrence is visited; the highest-priority category wins
+        if CLASSIFY_AUTOMATON is not None:
+            best = min(
+                (priority for _, priority in CLASSIFY_AUTOMATON.iter(name_lower)),
+                default=best,
+            )
+        else:
+            pos = 0
+            while best:
+                match = CLASSIFY_RE.search(name_lower, pos)
+                if match is None:
+                    break
+                best = min(best, CLASSIFY_TERM_PRIORITY[match.group()])
+                pos = match.start() + 1
+
+        return CLASSIFY_RULES[best][0] if best < len(CLASSIFY_RULES) else "other"
 
 
 class ReactTypeScriptParser(ComponentParser):
@@ -104,8 +173,7 @@ class ReactTypeScriptParser(ComponentParser):
     def parse(file_path: str) -> Optional[ComponentMetadata]:
         """Parse React TypeScript component"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = Path(file_path).read_text(encoding="utf-8")
 
             # Extract component name
             name = ReactTypeScriptParser._extract_component_name(content, file_path)
@@ -128,7 +196,7 @@ class ReactTypeScriptParser(ComponentParser):
                 name=name,
                 file_path=file_path,
                 framework="react",
-                props=props,
+                props=tuple(props),
                 component_type=component_type,
                 has_children=has_children,
                 exports_default=exports_default,
@@ -143,19 +211,13 @@ class ReactTypeScriptParser(ComponentParser):
         """Extract component name from file"""
 
         # Try function component: function ComponentName
-        match = re.search(r"function\s+([A-Z][A-Za-z0-9_]*)", content)
+        match = FUNC_COMPONENT_RE.search(content)
         if match:
             return match.group(1)
 
         # Try arrow function: const ComponentName =
-        match = re.search(r"const\s+([A-Z][A-Za-z0-9_]*)\s*[=:]", content)
-        if match:
-            return match.group(1)
-
-        # Try export: export function ComponentName
-        match = re.search(
-            r"export\s+(?:default\s+)?function\s+([A-Z][A-Za-z0-9_]*)", content
-        )
+        # (export function ComponentName is already covered by the search above)
+        match = CONST_COMPONENT_RE.search(content)
         if match:
             return match.group(1)
 
@@ -167,44 +229,28 @@ class ReactTypeScriptParser(ComponentParser):
         """Extract props from TypeScript interface or type"""
         props = []
 
-        # Find interface or type definition
+        # Find interface or type definition in one pass, keeping the first
+        # occurrence of the most preferred form
         # Pattern: interface ButtonProps { ... }
-        interface_pattern = rf"interface\s+{component_name}Props\s*\{{([^}}]+)\}}"
-        match = re.search(interface_pattern, content, re.DOTALL)
-
-        if not match:
-            # Try generic Props interface
-            interface_pattern = r"interface\s+Props\s*\{([^}]+)\}"
-            match = re.search(interface_pattern, content, re.DOTALL)
-
-        if not match:
-            # Try type definition
-            type_pattern = rf"type\s+{component_name}Props\s*=\s*\{{([^}}]+)\}}"
-            match = re.search(type_pattern, content, re.DOTALL)
-
-        if not match:
-            # Try generic Props type
-            type_pattern = r"type\s+Props\s*=\s*\{([^}]+)\}"
-            match = re.search(type_pattern, content, re.DOTALL)
+        match = None
+        for candidate in props_declaration_re(component_name).finditer(content):
+            if match is None or candidate.lastindex < match.lastindex:
+                match = candidate
+                if match.lastindex == 1:
+                    break
 
         if match:
-            props_block = match.group(1)
+            # Clean up types up front (remove newlines, extra spaces)
+            props_block = WHITESPACE_RE.sub(" ", match.group(match.lastindex))
 
             # Parse each prop
             # Pattern: propName?: type; or propName: type;
-            prop_pattern = r"(\w+)(\?)?:\s*([^;]+);?"
-
-            for prop_match in re.finditer(prop_pattern, props_block):
-                name = prop_match.group(1)
-                optional = prop_match.group(2) == "?"
-                prop_type = prop_match.group(3).strip()
-
-                # Clean up type (remove newlines, extra spaces)
-                prop_type = " ".join(prop_type.split())
-
-                props.append(
-                    PropDefinition(name=name, type=prop_type, required=not optional)
+            props = [
+                PropDefinition(
+                    name=name, type=prop_type.strip(), required=optional != "?"
                 )
+                for name, optional, prop_type in TS_PROP_RE.findall(props_block)
+            ]
 
         return props
 
@@ -216,8 +262,7 @@ class VueParser(ComponentParser):
     def parse(file_path: str) -> Optional[ComponentMetadata]:
         """Parse Vue component"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = Path(file_path).read_text(encoding="utf-8")
 
             # Extract component name from filename
             name = Path(file_path).stem
@@ -235,7 +280,7 @@ class VueParser(ComponentParser):
                 name=name,
                 file_path=file_path,
                 framework="vue",
-                props=props,
+                props=tuple(props),
                 component_type=component_type,
                 has_children=has_children,
                 exports_default=True,
@@ -251,43 +296,32 @@ class VueParser(ComponentParser):
         props = []
 
         # Pattern: defineProps<{ ... }>()
-        match = re.search(r"defineProps<\{([^}]+)\}>", content, re.DOTALL)
+        match = VUE_DEFINE_PROPS_RE.search(content)
 
         if match:
             props_block = match.group(1)
 
             # Parse each prop
-            prop_pattern = r"(\w+)(\?)?:\s*([^;,]+)"
-
-            for prop_match in re.finditer(prop_pattern, props_block):
-                name = prop_match.group(1)
-                optional = prop_match.group(2) == "?"
-                prop_type = prop_match.group(3).strip()
-
-                props.append(
-                    PropDefinition(name=name, type=prop_type, required=not optional)
+            props = [
+                PropDefinition(
+                    name=name, type=prop_type.strip(), required=optional != "?"
                 )
+                for name, optional, prop_type in VUE_PROP_RE.findall(props_block)
+            ]
 
         # Also try runtime defineProps
         # Pattern: defineProps({ prop: { type: String, required: true } })
-        runtime_match = re.search(r"defineProps\(\{([^}]+)\}\)", content, re.DOTALL)
+        runtime_match = VUE_RUNTIME_PROPS_RE.search(content)
         if runtime_match and not props:
             props_block = runtime_match.group(1)
 
             # Simple parsing for runtime props
-            prop_pattern = (
-                r"(\w+):\s*\{[^}]*type:\s*(\w+)[^}]*required:\s*(true|false)?[^}]*\}"
-            )
-
-            for prop_match in re.finditer(prop_pattern, props_block):
-                name = prop_match.group(1)
-                prop_type = prop_match.group(2)
-                required_str = prop_match.group(3)
-                required = required_str == "true" if required_str else False
-
-                props.append(
-                    PropDefinition(name=name, type=prop_type, required=required)
+            props = [
+                PropDefinition(name=name, type=prop_type, required=required == "true")
+                for name, prop_type, required in VUE_RUNTIME_PROP_RE.findall(
+                    props_block
                 )
+            ]
 
         return props
 
@@ -299,8 +333,7 @@ class SvelteParser(ComponentParser):
     def parse(file_path: str) -> Optional[ComponentMetadata]:
         """Parse Svelte component"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = Path(file_path).read_text(encoding="utf-8")
 
             # Extract component name from filename
             name = Path(file_path).stem
@@ -318,7 +351,7 @@ class SvelteParser(ComponentParser):
                 name=name,
                 file_path=file_path,
                 framework="svelte",
-                props=props,
+                props=tuple(props),
                 component_type=component_type,
                 has_children=has_children,
                 exports_default=True,
@@ -336,12 +369,9 @@ class SvelteParser(ComponentParser):
         # Pattern: export let propName: type = defaultValue;
         # or: export let propName: type;
         # or: export let propName = defaultValue;
-        prop_pattern = r"export\s+let\s+(\w+)(?::\s*([^=;]+))?(?:\s*=\s*([^;]+))?;?"
-
-        for match in re.finditer(prop_pattern, content):
-            name = match.group(1)
-            prop_type = match.group(2).strip() if match.group(2) else "any"
-            default = match.group(3).strip() if match.group(3) else None
+        for name, prop_type, default in SVELTE_EXPORT_RE.findall(content):
+            prop_type = prop_type.strip() if prop_type else "any"
+            default = default.strip() if default else None
 
             # If has default value, it's optional
             required = default is None
@@ -355,6 +385,155 @@ class SvelteParser(ComponentParser):
         return props
 
 
+# Parser for each supported component file extension
+PARSERS_BY_EXTENSION = {
+    ".tsx": ReactTypeScriptParser,
+    ".jsx": ReactTypeScriptParser,
+    ".ts": ReactTypeScriptParser,
+    ".js": ReactTypeScriptParser,
+    ".vue": VueParser,
+    ".svelte": SvelteParser,
+}
+
+
+# Parse results persisted across runs
+PARSE_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "storybook-assistant"
+    / "parse.db"
+)
+
+# Rows kept when the cache is written; the least recently stored go first
+PARSE_CACHE_MAX_ENTRIES = 5000
+
+# A parse cache row: resolved path, mtime_ns, size and the metadata as JSON
+CacheRow = Tuple[str, int, int, str]
+
+
+class ParseCache:
+    """On-disk cache of parsed metadata for unchanged files
+
+    Rows are keyed by resolved path and are only reused while the file's mtime
+    and size match and this script is unchanged (so editing a parser
+    invalidates every cached result); malformed rows are a miss. A lookup reads
+    a single row, so a one-file run never loads the whole cache. Writes are
+    queued and committed in one transaction at exit, which also drops all but
+    the PARSE_CACHE_MAX_ENTRIES most recently stored rows.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        parser_stat = os.stat(__file__)
+        self.parser = f"{parser_stat.st_mtime_ns}:{parser_stat.st_size}"
+        self.conn: Optional[sqlite3.Connection] = None
+        self.conn_pid: Optional[int] = None
+        self.pending: Dict[str, Tuple[int, int, str]] = {}
+        self.save_registered = False
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use in this process, or None if it can't be"""
+        # A connection inherited from a forking parent must not be reused
+        if self.conn_pid != os.getpid():
+            self.conn_pid = os.getpid()
+            self.conn = None
+            try:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.db_path))
+                # A write lost in a crash only costs a re-parse
+                conn.execute("PRAGMA synchronous = OFF")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS components ("
+                    "path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, "
+                    "parser TEXT, metadata_json TEXT)"
+                )
+                self.conn = conn
+            except (OSError, sqlite3.Error):
+                pass
+        return self.conn
+
+    def get(
+        self, key: str, stat: os.stat_result, file_path: str
+    ) -> Optional[ComponentMetadata]:
+        """Return cached metadata if the file is unchanged since it was stored"""
+        row = self.pending.get(key)
+        if row is None:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                stored = conn.execute(
+                    "SELECT mtime, size, parser, metadata_json "
+                    "FROM components WHERE path = ?",
+                    (key,),
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+            if stored is None or stored[2] != self.parser:
+                return None
+            row = (stored[0], stored[1], stored[3])
+
+        if row[:2] != (stat.st_mtime_ns, stat.st_size):
+            return None
+        try:
+            data = dict(json.loads(row[2]), file_path=file_path)
+            data["props"] = tuple(PropDefinition(**prop) for prop in data["props"])
+            return ComponentMetadata(**data)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def put(self, key: str, stat: os.stat_result, metadata: ComponentMetadata):
+        """Queue metadata parsed from a file with the given (pre-parse) stat"""
+        self.queue(
+            [(key, stat.st_mtime_ns, stat.st_size, json.dumps(asdict(metadata)))]
+        )
+
+    def queue(self, rows: List[CacheRow]):
+        """Queue rows to be written at exit"""
+        for key, mtime_ns, size, metadata_json in rows:
+            self.pending[key] = (mtime_ns, size, metadata_json)
+        if self.pending and not self.save_registered:
+            self.save_registered = True
+            atexit.register(self.save)
+
+    def take_pending(self) -> List[CacheRow]:
+        """Return and forget the queued rows, e.g. to hand them to a parent process"""
+        rows = [(key, *row) for key, row in self.pending.items()]
+        self.pending.clear()
+        return rows
+
+    def save(self):
+        """Commit queued rows in one transaction; failures only cost a re-parse"""
+        rows = [(key, *row, self.parser) for key, row in self.pending.items()]
+        self.pending.clear()
+        conn = self._connect() if rows else None
+        if conn is None:
+            return
+
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO components "
+                    "(path, mtime, size, metadata_json, parser) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                conn.execute("DELETE FROM components WHERE parser != ?", (self.parser,))
+                # REPLACE gives a row a fresh rowid, so rowids follow storage order
+                conn.execute(
+                    "DELETE FROM components WHERE rowid <= (SELECT rowid "
+                    "FROM components ORDER BY rowid DESC LIMIT 1 OFFSET ?)",
+                    (PARSE_CACHE_MAX_ENTRIES,),
+                )
+        except sqlite3.Error:
+            pass
+
+
+PARSE_CACHE = ParseCache(PARSE_CACHE_PATH)
+
+
+def _cache_key(file_path_obj: Path) -> Tuple[str, os.stat_result]:
+    return str(file_path_obj.resolve()), file_path_obj.stat()
+
+
 def parse_component(file_path: str) -> Optional[ComponentMetadata]:
     """Parse component file and return metadata"""
 
@@ -362,16 +541,38 @@ def parse_component(file_path: str) -> Optional[ComponentMetadata]:
     extension = file_path_obj.suffix.lower()
 
     # Determine parser based on file extension
-    if extension in [".tsx", ".jsx", ".ts", ".js"]:
-        return ReactTypeScriptParser.parse(file_path)
-    elif extension == ".vue":
-        return VueParser.parse(file_path)
-    elif extension == ".svelte":
-        return SvelteParser.parse(file_path)
-    else:
+    parser = PARSERS_BY_EXTENSION.get(extension)
+    if parser is None:
         print(f"Unsupported file type: {extension}", file=sys.stderr)
         return None
 
+    # Reuse the stored result for files unchanged since the last parse. The
+    # file is stat'ed before it is read, so an edit made meanwhile is a miss
+    # next time rather than stale metadata under the new mtime and size.
+    try:
+        key, stat = _cache_key(file_path_obj)
+    except OSError:
+        return parser.parse(file_path)
+
+    cached = PARSE_CACHE.get(key, stat, file_path)
+    if cached is not None:
+        return cached
+
+    metadata = parser.parse(file_path)
+    if metadata is not None:
+        PARSE_CACHE.put(key, stat, metadata)
+    return metadata
+
+
+def take_parsed() -> List[CacheRow]:
+    """Hand over this process's newly parsed results (worker caches are never saved)"""
+    return PARSE_CACHE.take_pending()
+
+
+def remember_parsed(rows: List[CacheRow]):
+    """Queue results parsed in a worker process for this process's parse cache"""
+    PARSE_CACHE.queue(rows)
+
 
 def main():
     """CLI interface"""
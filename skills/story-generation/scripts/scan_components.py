@@ -3,10 +3,29 @@
 Component scanner for finding all components in a project
 """
 
+import os
+import re
+import sys
 import json
+import fnmatch
+from collections import deque
 from pathlib import Path
-from typing import List, Dict, Any
-from parse_component import parse_component
+from typing import Any, Dict, FrozenSet, List, Optional, Pattern, Tuple
+from parse_component import (
+    CacheRow,
+    ComponentMetadata,
+    parse_component,
+    remember_parsed,
+    take_parsed,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Below this many files the process pool costs more than it saves
+PARALLEL_MIN_FILES = 8
 
 
 class ComponentScanner:
@@ -34,12 +53,14 @@ class ComponentScanner:
 
     # Component file extensions
     COMPONENT_EXTENSIONS = [".tsx", ".jsx", ".vue", ".svelte", ".ts", ".js"]
+    COMPONENT_EXTENSION_SET = frozenset(COMPONENT_EXTENSIONS)
 
     @staticmethod
     def scan(
         root_dir: str,
         include_patterns: List[str] = None,
         exclude_patterns: List[str] = None,
+        ignore_hidden: bool = True,
     ) -> List[Dict[str, Any]]:
         """
         Scan directory for components
@@ -48,6 +69,7 @@ class ComponentScanner:
             root_dir: Root directory to scan
             include_patterns: Additional patterns to include
             exclude_patterns: Additional patterns to exclude
+            ignore_hidden: Skip directories whose names start with "."
 
         Returns:
             List of component metadata dicts
@@ -64,93 +86,144 @@ class ComponentScanner:
         if exclude_patterns:
             exclude.extend(exclude_patterns)
 
-        # Find all component files
+        # Find all component files in a single walk, pruning excluded directories
+        exclude_dirs, exclude_re = ComponentScanner._compile_excludes(exclude)
+        root_str = str(root_path)
         component_files = []
 
-        for ext in ComponentScanner.COMPONENT_EXTENSIONS:
-            for file_path in root_path.rglob(f"*{ext}"):
+        # Directories to visit, each with whether its path mentions "component";
+        # a root inside an excluded directory has nothing to scan
+        pending = deque()
+        if exclude_dirs.isdisjoint(root_path.parts):
+            pending.append((root_str, "component" in root_str.lower()))
+
+        while pending:
+            dir_path, dir_has_component = pending.pop()
+            try:
+                entries = list(os.scandir(dir_path))
+            except OSError:
+                # Unreadable directories are skipped, as rglob does
+                continue
+
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    # Excluded and hidden directories are never entered
+                    if ignore_hidden and name.startswith("."):
+                        continue
+                    if name not in exclude_dirs:
+                        has_component = dir_has_component or "component" in name.lower()
+                        pending.append((entry.path, has_component))
+                    continue
+
+                ext = os.path.splitext(name)[1]
+                if ext not in ComponentScanner.COMPONENT_EXTENSION_SET:
+                    continue
+                if not entry.is_file():
+                    continue
+
                 # Skip excluded patterns
-                if ComponentScanner._should_exclude(file_path, exclude):
+                if name in exclude_dirs or (
+                    exclude_re is not None and exclude_re.match(entry.path)
+                ):
                     continue
 
                 # Check if it looks like a component
-                if ComponentScanner._is_component_file(file_path):
-                    component_files.append(file_path)
+                if ComponentScanner._is_component_name(name, dir_has_component):
+                    component_files.append(entry.path)
 
         print(f"Found {len(component_files)} potential component files")
 
-        # Parse each component
-        components = []
-        for file_path in component_files:
-            try:
-                metadata = parse_component(str(file_path))
-                if metadata:
-                    # Convert to dict
-                    component_dict = {
-                        "name": metadata.name,
-                        "file_path": str(file_path.relative_to(root_path)),
-                        "framework": metadata.framework,
-                        "component_type": metadata.component_type,
-                        "props_count": len(metadata.props),
-                        "has_children": metadata.has_children,
-                        "props": [
-                            {
-                                "name": p.name,
-                                "type": p.type,
-                                "required": p.required,
-                            }
-                            for p in metadata.props
-                        ],
-                    }
-                    components.append(component_dict)
-            except Exception as e:
-                print(f"Error parsing {file_path}: {e}")
-                continue
+        # Parse each component, fanning out to worker processes for large projects
+        if len(component_files) < PARALLEL_MIN_FILES:
+            parsed = list(map(_parse_one, component_files))
+        else:
+            from concurrent.futures import ProcessPoolExecutor
 
-        print(f"Successfully parsed {len(components)} components")
-        return components
-
-    @staticmethod
-    def _should_exclude(file_path: Path, exclude_patterns: List[str]) -> bool:
-        """Check if file should be excluded"""
-        file_str = str(file_path)
+            workers = min(os.cpu_count() or 1, 8)
+            chunksize = max(1, min(32, len(component_files) // (workers * 4)))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(_parse_in_worker, component_files, chunksize=chunksize)
+                )
 
-        for pattern in exclude_patterns:
-            # Exact directory match
-            if pattern in file_path.parts:
-                return True
+            # Workers exit without saving their caches, so keep results here
+            parsed = []
+            for metadata, rows in results:
+                parsed.append(metadata)
+                remember_parsed(rows)
 
-            # Wildcard pattern
-            if "*" in pattern:
-                import fnmatch
+        # Every walked path starts with the root, so relative paths are a slice
+        root_prefix_len = len(os.path.join(root_str, ""))
 
-                if fnmatch.fnmatch(file_str, f"*{pattern}"):
-                    return True
+        components = []
+        for file_path, metadata in zip(component_files, parsed):
+            if metadata:
+                # Convert to dict
+                component_dict = {
+                    "name": metadata.name,
+                    "file_path": file_path[root_prefix_len:],
+                    "framework": metadata.framework,
+                    "component_type": metadata.component_type,
+                    "props_count": len(metadata.props),
+                    "has_children": metadata.has_children,
+                    "props": [
+                        {
+                            "name": p.name,
+                            "type": p.type,
+                            "required": p.required,
+                        }
+                        for p in metadata.props
+                    ],
+                }
+                components.append(component_dict)
 
-        return False
+        print(f"Successfully parsed {len(components)} components")
+        return components
 
     @staticmethod
-    def _is_component_file(file_path: Path) -> bool:
-        """Check if file is likely a component"""
+    def _compile_excludes(
+        exclude_patterns: List[str],
+    ) -> Tuple[FrozenSet[str], Optional[Pattern[str]]]:
+        """Split exclude patterns into directory names and one wildcard regex"""
+        exclude_dirs = frozenset(p for p in exclude_patterns if "*" not in p)
+        wildcards = [p for p in exclude_patterns if "*" in p]
+        if not wildcards:
+            return exclude_dirs, None
+
+        exclude_re = re.compile("|".join(fnmatch.translate(f"*{p}") for p in wildcards))
+        return exclude_dirs, exclude_re
 
-        # Must be a valid component extension
-        if file_path.suffix not in ComponentScanner.COMPONENT_EXTENSIONS:
-            return False
+    @staticmethod
+    def _is_component_name(name: str, dir_has_component: bool) -> bool:
+        """Check if a file with a component extension is likely a component"""
 
         # Component files usually start with uppercase
-        filename = file_path.stem
-        if filename[0].isupper():
+        if name[:1].isupper():
             return True
 
         # Or are in a components directory
-        if "component" in str(file_path).lower():
+        if dir_has_component or "component" in name.lower():
             return True
 
         # Or are named index (for directory-based components)
-        if filename.lower() == "index":
-            return True
+        return name.rpartition(".")[0].lower() == "index"
+
+
+def _parse_one(file_path: str) -> Optional[ComponentMetadata]:
+    """Parse one component file, reporting errors instead of raising"""
+    try:
+        return parse_component(file_path)
+    except Exception as e:
+        print(f"Error parsing {file_path}: {e}")
+        return None
+
 
-        return False
+def _parse_in_worker(
+    file_path: str
+) -> Tuple[Optional[ComponentMetadata], List[CacheRow]]:
+    """Parse one file in a worker process, handing back its new cache rows"""
+    return _parse_one(file_path), take_parsed()
 
 
 def main():
@@ -168,31 +241,48 @@ def main():
     parser.add_argument(
         "--exclude", action="append", help="Additional patterns to exclude"
     )
+    parser.add_argument(
+        "--include-hidden",
+        action="store_true",
+        help="Also scan directories whose names start with '.'",
+    )
 
     args = parser.parse_args()
 
     # Scan for components
-    components = ComponentScanner.scan(args.root_dir, exclude_patterns=args.exclude)
+    components = ComponentScanner.scan(
+        args.root_dir,
+        exclude_patterns=args.exclude,
+        ignore_hidden=not args.include_hidden,
+    )
 
     if args.json:
-        print(json.dumps(components, indent=2))
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+            sys.stdout.flush()
+            sys.stdout.buffer.write(orjson.dumps(components, option=option))
+        else:
+            print(json.dumps(components, indent=2))
     else:
-        print(f"\n📦 Found {len(components)} components:\n")
+        # Collect the report and write it once rather than per line
+        lines = [f"\n📦 Found {len(components)} components:\n"]
 
         # Group by framework
         by_framework = {}
         for comp in components:
-            framework = comp["framework"]
-            if framework not in by_framework:
-                by_framework[framework] = []
-            by_framework[framework].append(comp)
+            by_framework.setdefault(comp["framework"], []).append(comp)
 
         for framework, comps in sorted(by_framework.items()):
-            print(f"\n{framework.upper()}:")
+            lines.append(f"\n{framework.upper()}:")
             for comp in sorted(comps, key=lambda c: c["name"]):
-                print(f"  • {comp['name']}")
-                print(f"    {comp['file_path']}")
-                print(f"    {comp['props_count']} props • {comp['component_type']}")
+                lines.append(f"  • {comp['name']}")
+                lines.append(f"    {comp['file_path']}")
+                lines.append(
+                    f"    {comp['props_count']} props • {comp['component_type']}"
+                )
+
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -7,29 +7,90 @@ Requires: OPENROUTER_API_KEY environment variable
 import os
 import sys
 import base64
+import binascii
 import json
 import argparse
+from functools import lru_cache
 from pathlib import Path
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Error: requests library not installed")
     print("Install with: pip install requests")
     sys.exit(1)
 
+# OpenRouter API endpoint
+OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+# Base64 characters decoded per write; a multiple of 4 so chunks decode independently
+BASE64_CHUNK_CHARS = 64 * 1024
+
+# One pooled keep-alive session, so repeated generations skip the TLS handshake.
+# Only "not processed" statuses are retried, since a generation is not idempotent:
+# connection and read errors (including timeouts) are raised on the first failure.
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=None,
+            connect=0,
+            read=False,
+            other=0,
+            status=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 503),
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        ),
+    ),
+)
+HTTP_SESSION.headers.update(
+    {
+        "HTTP-Referer": "https://github.com/flight505/storybook-assistant-plugin",
+        "X-Title": "Storybook Assistant Plugin",
+    }
+)
+
+
+@lru_cache(maxsize=None)
+def _load_env_file(path: str, mtime_ns: int):
+    """Apply a .env file to os.environ once per path and modification time"""
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, value = line.split("=", 1)
+                if key not in os.environ:
+                    os.environ[key] = value.strip('"').strip("'")
+
 
 def load_env():
     """Load .env file if it exists"""
     env_file = Path.cwd() / ".env"
-    if env_file.exists():
-        with open(env_file) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    if key not in os.environ:
-                        os.environ[key] = value.strip('"').strip("'")
+    try:
+        mtime_ns = env_file.stat().st_mtime_ns
+    except OSError:
+        return
+    _load_env_file(str(env_file), mtime_ns)
+
+
+def write_base64(f, data: str):
+    """Decode base64 into a binary file in chunks, never holding the whole image"""
+    try:
+        for start in range(0, len(data), BASE64_CHUNK_CHARS):
+            chunk = data[start : start + BASE64_CHUNK_CHARS]
+            f.write(base64.b64decode(chunk, validate=True))
+    except binascii.Error:
+        # Whitespace or stray characters shift chunk boundaries; decode leniently
+        f.seek(0)
+        f.truncate()
+        f.write(base64.b64decode(data))
 
 
 def generate_mockup(prompt: str, model: str, output_path: str) -> bool:
@@ -50,20 +111,14 @@ def generate_mockup(prompt: str, model: str, output_path: str) -> bool:
     print(f"🎨 Generating mockup with {model}...")
     print(f"📝 Prompt: {prompt[:100]}...")
 
-    # OpenRouter API endpoint
-    url = "https://openrouter.ai/api/v1/chat/completions"
-
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": "https://github.com/flight505/storybook-assistant-plugin",
-        "X-Title": "Storybook Assistant Plugin",
-    }
+    headers = {"Authorization": f"Bearer {api_key}"}
 
     payload = {"model": model, "messages": [{"role": "user", "content": prompt}]}
 
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=60)
+        response = HTTP_SESSION.post(
+            OPENROUTER_URL, json=payload, headers=headers, timeout=60
+        )
         response.raise_for_status()
 
         data = response.json()
@@ -98,7 +153,7 @@ def generate_mockup(prompt: str, model: str, output_path: str) -> bool:
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
         with open(output_file, "wb") as f:
-            f.write(base64.b64decode(image_data))
+            write_base64(f, image_data)
 
         print(f"✅ Mockup saved: {output_file}")
         return True
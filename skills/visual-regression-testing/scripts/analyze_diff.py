@@ -9,14 +9,17 @@ Analyzes visual diffs with context awareness to categorize changes as:
 - ERROR: Clear regressions (block merge)
 """
 
+import filecmp
 import json
 import os
 import subprocess
 import sys
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from PIL import Image
@@ -26,6 +29,47 @@ except ImportError:
     print("Run: pip install Pillow numpy")
     sys.exit(1)
 
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Per-channel difference above which a pixel counts as changed
+PIXEL_DIFF_THRESHOLD = 10
+
+# Rows compared per strip, keeping the diff buffers cache-resident
+PIXEL_DIFF_TILE_ROWS = 256
+
+# RGBX pixels compared as one uint32 word each, ignoring the padding byte
+RGB_WORD_MASK = np.array([255, 255, 255, 0], dtype=np.uint8).view(np.uint32)[0]
+
+# Commit message terms suggesting a change of each type was intended
+COMMIT_KEYWORDS = {
+    "color": ["color", "theme", "palette"],
+    "position": ["layout", "position", "flexbox", "grid", "spacing"],
+    "size": ["size", "width", "height", "dimensions"],
+    "text": ["text", "content", "copy", "typography"],
+}
+
+# Design token locations, relative to the project root
+TOKEN_PATHS = [
+    "src/tokens/",
+    "src/theme/",
+    "src/styles/tokens/",
+    "design-tokens.json",
+]
+
+# Tokens and commits persisted across runs, keyed by what they were built from
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "storybook-assistant"
+)
+
 
 class Category(Enum):
     """Change category classification"""
@@ -63,125 +107,277 @@ class AnalysisContext:
     pr_description: Optional[str]
     baseline_path: str
     current_path: str
+    flat_tokens: Dict = field(init=False, repr=False)
+    tokens_by_value: Dict[Any, List[str]] = field(init=False, repr=False)
+    commit_messages: List[str] = field(init=False, repr=False)
+    commits_by_term: Dict[str, List[int]] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Flattened and inverted once so token lookups per change are O(1)
+        self.flat_tokens = flatten_dict(self.design_tokens)
+        self.tokens_by_value = index_tokens_by_value(self.flat_tokens)
+
+        # Commit indices per search term, filled as terms are first looked up
+        self.commit_messages = [
+            c.get("message_lower") or c["message"].lower() for c in self.recent_commits
+        ]
+        self.commits_by_term = {}
+
 
+def read_json_file(path) -> Any:
+    """Parse a JSON file from its raw bytes, with orjson when available"""
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
+
+def _read_cache(name: str, key: Any) -> Optional[Any]:
+    """Return the value cached under name if it was stored for this key"""
+    try:
+        entry = read_json_file(CACHE_DIR / name)
+    except (OSError, ValueError):
+        return None
+    return entry["value"] if entry.get("key") == key else None
+
+
+def _write_cache(name: str, key: Any, value: Any):
+    """Write a cache entry atomically; failures only cost a rebuild"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = CACHE_DIR / f"{name}.{os.getpid()}.tmp"
+        tmp_file.write_text(json.dumps({"key": key, "value": value}), encoding="utf-8")
+        os.replace(tmp_file, CACHE_DIR / name)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=8)
 def get_recent_commits(days: int = 7) -> List[Dict]:
     """Get recent git commits for context"""
     try:
+        # Commits only change when a ref moves, so the ref heads key the cache
+        refs = subprocess.run(
+            ["git", "rev-parse", "HEAD", "--all"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        key = {"cwd": os.getcwd(), "days": days, "refs": refs}
+        cached = _read_cache("commits-v2.json", key)
+        if cached is not None:
+            since = int(time.time()) - days * 86400
+            return [commit for commit in cached if commit["timestamp"] >= since]
+
+        # NUL between commits and unit separators between fields, so no commit
+        # message can break the parse; the output is decoded once
         cmd = [
             "git",
             "log",
             f"--since={days} days ago",
-            "--pretty=format:%H|%an|%ae|%s|%ct",
+            "-z",
+            "--pretty=format:%H%x1f%an%x1f%ae%x1f%s%x1f%ct",
             "--all",
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result = subprocess.run(cmd, capture_output=True, check=True)
 
         commits = []
-        for line in result.stdout.strip().split("\n"):
-            if not line:
+        for record in result.stdout.decode("utf-8", errors="replace").split("\0"):
+            if not record:
                 continue
-            sha, author, email, message, timestamp = line.split("|")
+            sha, author, email, message, timestamp = record.split("\x1f")
             commits.append(
                 {
                     "sha": sha,
                     "author": author,
                     "email": email,
                     "message": message,
+                    "message_lower": message.lower(),
                     "timestamp": int(timestamp),
                 }
             )
+
+        _write_cache("commits-v2.json", key, commits)
         return commits
     except (subprocess.CalledProcessError, FileNotFoundError):
         return []
 
 
+def _token_files_key() -> List:
+    """Describe every token file by path, mtime and size"""
+    key: List = [os.getcwd()]
+    for path in TOKEN_PATHS:
+        if os.path.isdir(path):
+            files = Path(path).rglob("*.json")
+        elif os.path.exists(path):
+            files = [Path(path)]
+        else:
+            continue
+
+        for file in files:
+            try:
+                stat = file.stat()
+                key.append([str(file), stat.st_mtime_ns, stat.st_size])
+            except OSError:
+                key.append([str(file), None, None])
+    return key
+
+
+@lru_cache(maxsize=1)
 def load_design_tokens() -> Dict:
     """Load design tokens from project"""
-    token_paths = [
-        "src/tokens/",
-        "src/theme/",
-        "src/styles/tokens/",
-        "design-tokens.json",
-    ]
+    key = _token_files_key()
+    cached = _read_cache("tokens-v1.json", key)
+    if cached is not None:
+        return cached
 
     tokens = {}
 
-    for path in token_paths:
+    for path in TOKEN_PATHS:
         if os.path.exists(path):
             if os.path.isdir(path):
                 # Load all JSON/TS files in directory
                 for file in Path(path).rglob("*.json"):
                     try:
-                        with open(file, "r") as f:
-                            file_tokens = json.load(f)
-                            tokens.update(file_tokens)
-                    except (json.JSONDecodeError, IOError):
+                        tokens.update(read_json_file(file))
+                    except (ValueError, IOError):
                         continue
             elif path.endswith(".json"):
                 try:
-                    with open(path, "r") as f:
-                        tokens = json.load(f)
-                        break
-                except (json.JSONDecodeError, IOError):
+                    tokens = read_json_file(path)
+                    break
+                except (ValueError, IOError):
                     continue
 
+    _write_cache("tokens-v1.json", key, tokens)
     return tokens
 
 
-def check_token_match(old_value: str, new_value: str, tokens: Dict) -> Optional[Dict]:
+def index_tokens_by_value(flat_tokens: Dict) -> Dict[Any, List[str]]:
+    """Map each token value to the names of the tokens that define it"""
+    tokens_by_value: Dict[Any, List[str]] = {}
+    for key, value in flat_tokens.items():
+        # Tokens are {"value": ...} objects, flattened to "<token name>.value"
+        if not key.endswith(".value"):
+            continue
+        try:
+            tokens_by_value.setdefault(value, []).append(key[: -len(".value")])
+        except TypeError:
+            continue
+    return tokens_by_value
+
+
+def check_token_match(
+    old_value: str, new_value: str, tokens_by_value: Dict[Any, List[str]]
+) -> Optional[Dict]:
     """Check if change matches a design token update"""
-    # Flatten nested tokens
-    flat_tokens = flatten_dict(tokens)
-
-    # Look for tokens with old value that changed to new value
-    for token_name, token_value in flat_tokens.items():
-        if isinstance(token_value, dict):
-            if token_value.get("value") == new_value:
-                # Found new value, check if old value was previous
-                return {
-                    "token_name": token_name,
-                    "old_value": old_value,
-                    "new_value": new_value,
-                }
+    # Look for a token whose value is the new value
+    token_names = tokens_by_value.get(new_value)
+    if token_names:
+        return {
+            "token_name": token_names[0],
+            "old_value": old_value,
+            "new_value": new_value,
+        }
 
     return None
 
 
 def flatten_dict(d: Dict, parent_key: str = "", sep: str = ".") -> Dict:
     """Flatten nested dictionary"""
-    items = []
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.extend(flatten_dict(v, new_key, sep=sep).items())
+    flat = {}
+
+    # Depth-first over a stack of item iterators, keeping the original key order
+    stack = [(parent_key, iter(d.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            new_key = f"{prefix}{sep}{k}" if prefix else k
+            if isinstance(v, dict):
+                stack.append((new_key, iter(v.items())))
+                break
+            flat[new_key] = v
         else:
-            items.append((new_key, v))
-    return dict(items)
+            stack.pop()
+
+    return flat
+
+
+def count_changed_pixels(baseline_arr: np.ndarray, current_arr: np.ndarray) -> int:
+    """Count RGBX pixels whose channels differ by more than the threshold"""
+    height, width, _ = baseline_arr.shape
+    rows = min(PIXEL_DIFF_TILE_ROWS, height)
+    baseline_words = baseline_arr.view(np.uint32).reshape(height, width)
+    current_words = current_arr.view(np.uint32).reshape(height, width)
+
+    # Buffers reused across strips so the working set stays small
+    changed_words = np.empty((rows, width), dtype=np.uint32)
+    high = np.empty((rows, width, 4), dtype=np.uint8)
+    low = np.empty_like(high)
+    peak = np.empty((rows, width), dtype=np.uint8)
+
+    changed_pixels = 0
+    for top in range(0, height, rows):
+        bottom = min(top + rows, height)
+
+        # Whole-pixel word compare first; identical strips need no per-channel work
+        strip_words = changed_words[: bottom - top]
+        np.bitwise_xor(
+            baseline_words[top:bottom], current_words[top:bottom], out=strip_words
+        )
+        np.bitwise_and(strip_words, RGB_WORD_MASK, out=strip_words)
+        if not strip_words.any():
+            continue
+
+        strip_high, strip_low = high[: bottom - top], low[: bottom - top]
+        strip_peak = peak[: bottom - top]
+
+        # Absolute difference without uint8 wraparound
+        np.maximum(baseline_arr[top:bottom], current_arr[top:bottom], out=strip_high)
+        np.minimum(baseline_arr[top:bottom], current_arr[top:bottom], out=strip_low)
+        np.subtract(strip_high, strip_low, out=strip_high)
+
+        # Largest colour channel difference per pixel, one byte each
+        np.maximum(strip_high[..., 0], strip_high[..., 1], out=strip_peak)
+        np.maximum(strip_peak, strip_high[..., 2], out=strip_peak)
+
+        changed_pixels += int(np.count_nonzero(strip_peak > PIXEL_DIFF_THRESHOLD))
+
+    return changed_pixels
+
+
+def load_pixels(image_path: str) -> np.ndarray:
+    """Decode an image to 8-bit colour plus a padding byte, one 32-bit word per pixel"""
+    if cv2 is None:
+        return np.asarray(Image.open(image_path).convert("RGBX"))
+
+    # OpenCV decodes straight to an array; channel order does not matter for a diff
+    pixels = cv2.imread(image_path, cv2.IMREAD_COLOR | cv2.IMREAD_IGNORE_ORIENTATION)
+    if pixels is None:
+        raise IOError(f"cannot decode image {image_path}")
+    return cv2.cvtColor(pixels, cv2.COLOR_BGR2BGRA)
 
 
 def calculate_pixel_diff(baseline_path: str, current_path: str) -> Tuple[int, float]:
     """Calculate pixel difference between images"""
     try:
-        baseline = Image.open(baseline_path).convert("RGB")
-        current = Image.open(current_path).convert("RGB")
-
-        # Ensure same dimensions
-        if baseline.size != current.size:
+        # Byte-identical files (the usual "no change" run) need no decoding;
+        # filecmp compares sizes before reading any content
+        if filecmp.cmp(baseline_path, current_path, shallow=False):
+            return 0, 0.0
+
+        # Ensure same dimensions, from the headers alone before any decoding
+        with Image.open(baseline_path) as baseline, Image.open(current_path) as current:
+            if baseline.size != current.size:
+                raise ValueError("Image dimensions do not match")
+
+        baseline_arr = load_pixels(baseline_path)
+        current_arr = load_pixels(current_path)
+        if baseline_arr.shape != current_arr.shape:
             raise ValueError("Image dimensions do not match")
 
-        # Convert to numpy arrays
-        baseline_arr = np.array(baseline)
-        current_arr = np.array(current)
-
-        # Calculate difference
-        diff = np.abs(baseline_arr - current_arr)
-
-        # Count changed pixels (with threshold)
-        threshold = 10  # RGB difference threshold
-        changed_pixels = np.sum(np.any(diff > threshold, axis=2))
+        changed_pixels = count_changed_pixels(baseline_arr, current_arr)
 
-        total_pixels = baseline.size[0] * baseline.size[1]
+        total_pixels = baseline_arr.shape[0] * baseline_arr.shape[1]
         percentage = (changed_pixels / total_pixels) * 100
 
         return changed_pixels, percentage
@@ -210,7 +406,9 @@ def categorize_change(
 
     # Check design token match for color changes
     if change_type == "color":
-        token_match = check_token_match(old_value, new_value, context.design_tokens)
+        token_match = check_token_match(
+            old_value, new_value, context.tokens_by_value
+        )
         if token_match:
             return (
                 Category.EXPECTED,
@@ -220,9 +418,7 @@ def categorize_change(
             )
 
     # Check commit messages
-    relevant_commits = find_relevant_commits(
-        change_type, old_value, new_value, context.recent_commits
-    )
+    relevant_commits = find_relevant_commits(change_type, old_value, new_value, context)
 
     if relevant_commits:
         commit = relevant_commits[0]
@@ -261,25 +457,26 @@ def categorize_change(
 
 
 def find_relevant_commits(
-    change_type: str, old_value: str, new_value: str, commits: List[Dict]
+    change_type: str, old_value: str, new_value: str, context: AnalysisContext
 ) -> List[Dict]:
     """Find commits that might relate to this change"""
-    keywords = {
-        "color": ["color", "theme", "palette", new_value.lower()],
-        "position": ["layout", "position", "flexbox", "grid", "spacing"],
-        "size": ["size", "width", "height", "dimensions"],
-        "text": ["text", "content", "copy", "typography"],
-    }
-
-    relevant = []
-    search_terms = keywords.get(change_type, [])
-
-    for commit in commits:
-        message_lower = commit["message"].lower()
-        if any(term in message_lower for term in search_terms):
-            relevant.append(commit)
-
-    return relevant
+    search_terms = COMMIT_KEYWORDS.get(change_type, [])
+    if change_type == "color":
+        search_terms = [*search_terms, new_value.lower()]
+
+    # Each term is matched against the commits once per context
+    relevant = set()
+    for term in search_terms:
+        indices = context.commits_by_term.get(term)
+        if indices is None:
+            indices = context.commits_by_term[term] = [
+                i
+                for i, message in enumerate(context.commit_messages)
+                if term in message
+            ]
+        relevant.update(indices)
+
+    return [context.recent_commits[i] for i in sorted(relevant)]
 
 
 def analyze_visual_diff(context: AnalysisContext) -> Dict: